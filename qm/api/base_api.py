@@ -39,38 +39,43 @@ def timeout_error_message(timeout: Optional[float]) -> str:
     return f"A timeout of {timeout} seconds was reached. The timeout value can be configured either in the relevant API call (if supported) or when creating the QuantumMachinesManager instance."
 
 
-@contextlib.contextmanager
-def _handle_connection_error(timeout: Optional[float]) -> Generator[None, None, None]:
-    try:
-        yield
-    except grpc.RpcError as e:
+def _to_qm_connection_error(error: Union[grpc.RpcError, TimeoutError], timeout: Optional[float]) -> Exception:
+    """
+    Converts an error raised by a gRPC call to the matching QM exception. Should be called while handling the error.
+    """
+    if isinstance(error, TimeoutError):
         if is_debug():
-            logger.exception("Encountered connection error from QOP")
-
-        # Get status code from gRPC exception
-        status_code = e.code() if hasattr(e, "code") else None
-        details = e.details() if hasattr(e, "details") else str(e)
+            logger.exception(timeout_error_message(timeout))
+        return QMTimeoutError(timeout_error_message(timeout))
 
-        if status_code == grpc.StatusCode.UNIMPLEMENTED:
-            raise GatewayNotImplementedError(
-                f"Encountered connection error from QOP:  details: {details}, status: {status_code}"
-            ) from e
+    if is_debug():
+        logger.exception("Encountered connection error from QOP")
 
-        # Handle timeout specifically
-        if status_code == grpc.StatusCode.DEADLINE_EXCEEDED:
-            error_message = timeout_error_message(timeout)
-            if is_debug():
-                logger.exception(error_message)
-            raise QMTimeoutError(error_message) from e
+    # Get status code from gRPC exception
+    status_code = error.code() if hasattr(error, "code") else None
+    details = error.details() if hasattr(error, "details") else str(error)
 
-        raise QMConnectionError(
-            f"Encountered connection error from QOP: details: {details}, status:  {status_code}"
-        ) from e
+    if status_code == grpc.StatusCode.UNIMPLEMENTED:
+        return GatewayNotImplementedError(
+            f"Encountered connection error from QOP:  details: {details}, status: {status_code}"
+        )
 
-    except TimeoutError as e:
+    # Handle timeout specifically
+    if status_code == grpc.StatusCode.DEADLINE_EXCEEDED:
+        error_message = timeout_error_message(timeout)
         if is_debug():
-            logger.exception(timeout_error_message(timeout))
-        raise QMTimeoutError(timeout_error_message(timeout)) from e
+            logger.exception(error_message)
+        return QMTimeoutError(error_message)
+
+    return QMConnectionError(f"Encountered connection error from QOP: details: {details}, status:  {status_code}")
+
+
+@contextlib.contextmanager
+def _handle_connection_error(timeout: Optional[float]) -> Generator[None, None, None]:
+    try:
+        yield
+    except (grpc.RpcError, TimeoutError) as e:
+        raise _to_qm_connection_error(e, timeout) from e
 
 
 @runtime_checkable
@@ -89,12 +94,14 @@ MetadataLike = Sequence[Tuple[str, str]]
 
 
 class BaseApi(Generic[StubType], metaclass=ABCMeta):
+    __slots__ = ("_connection_details", "_channel", "_stub", "_timeout")
+
     def __init__(self, connection_details: ConnectionDetails):
         self._connection_details = connection_details
 
         self._channel = self._connection_details.channel
 
-        self._stub: StubType = self._stub_class(self._channel)  # type: ignore[assignment]
+        self._stub: StubType = self._connection_details.get_stub(self._stub_class)  # type: ignore[assignment]
 
         self._timeout: Optional[float] = self._connection_details.timeout
 
@@ -127,8 +134,12 @@ class BaseApi(Generic[StubType], metaclass=ABCMeta):
         # Guard before gRPC: invoking on a closed channel segfaults cygrpc.
         self._connection_details.raise_if_closed()
 
-        with _handle_connection_error(timeout):
+        # The errors are handled inline rather than with _handle_connection_error, since this is called for every
+        # unary RPC and a generator-based context manager adds overhead to each call
+        try:
             return grpc_method(request, timeout=timeout)
+        except (grpc.RpcError, TimeoutError) as e:
+            raise _to_qm_connection_error(e, timeout) from e
 
     def _run_iterator(
         self,
@@ -1,4 +1,5 @@
 import logging
+import itertools
 from typing import List, Type, Tuple, Optional
 
 from google.protobuf.empty_pb2 import Empty
@@ -94,9 +95,9 @@ class FrontendApi(BaseApi[FrontendStub]):
         if not response.success:
             open_qm_exception = OpenQmException(response.configValidationErrors, response.physicalValidationErrors)
 
-            for formatted_error in (
-                open_qm_exception.physical_validation_formatted_errors
-                + open_qm_exception.config_validation_formatted_errors
+            for formatted_error in itertools.chain(
+                open_qm_exception.physical_validation_formatted_errors,
+                open_qm_exception.config_validation_formatted_errors,
             ):
                 logger.error(formatted_error)
 
@@ -12,8 +12,8 @@ from qm.api.models.server_details import ConnectionDetails
 from qm.utils.general_utils import create_input_stream_name
 from qm.api.models.capabilities import QopCaps, ServerCapabilities
 from qm.grpc.qm.pb.job_manager_pb2_grpc import JobManagerServiceStub
+from qm.grpc.qm.pb import frontend_pb2, qm_manager_pb2, job_manager_pb2
 from qm.api.stubs.deprecated_job_manager_stub import DeprecatedJobManagerServiceStub
-from qm.grpc.qm.pb import frontend_pb2, qm_manager_pb2, job_manager_pb2, general_messages_pb2
 from qm._QmJobErrors import (
     MissingJobError,
     MissingElementError,
@@ -37,9 +37,12 @@ class JobManagerBaseApi(BaseApi[JobStubType], metaclass=ABCMeta):
         self._frontend_stub = FrontendStub(self._channel)  # type: ignore[no-untyped-call]
 
     def set_element_correction(
-        self, job_id: str, element_name: str, correction: general_messages_pb2.Matrix
+        self, job_id: str, element_name: str, correction: Tuple[float, float, float, float]
     ) -> Tuple[float, float, float, float]:
-        request = job_manager_pb2.SetElementCorrectionRequest(jobId=job_id, qeName=element_name, correction=correction)
+        request = job_manager_pb2.SetElementCorrectionRequest(jobId=job_id, qeName=element_name)
+        # The matrix is filled inside the request, instead of being built on its own and then copied into it
+        matrix = request.correction
+        matrix.v00, matrix.v01, matrix.v10, matrix.v11 = correction
 
         response: job_manager_pb2.SetElementCorrectionResponse = self._run(
             self._stub.SetElementCorrection, request, timeout=self._timeout
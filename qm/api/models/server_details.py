@@ -1,7 +1,7 @@
 import ssl
 import atexit
 import dataclasses
-from typing import Dict, Tuple, Optional
+from typing import Any, Dict, Type, Tuple, TypeVar, Optional
 
 from grpc import Channel
 
@@ -16,6 +16,8 @@ BASE_TIMEOUT = 120
 
 CLOSED_CONNECTION_MESSAGE = "QuantumMachinesManager has been closed. Create a new instance to issue further calls."
 
+StubT = TypeVar("StubT")
+
 
 @dataclasses.dataclass
 class ConnectionDetails:
@@ -29,6 +31,7 @@ class ConnectionDetails:
     debug_data: Optional[DebugData] = dataclasses.field(default=None)
     _channel: Optional[Channel] = dataclasses.field(repr=False, default=None)
     _closed: bool = dataclasses.field(repr=False, default=False)
+    _stubs: Dict[type, Any] = dataclasses.field(repr=False, default_factory=dict, compare=False)
 
     @property
     def is_closed(self) -> bool:
@@ -55,6 +58,21 @@ class ConnectionDetails:
 
         return self._channel
 
+    def get_stub(self, stub_class: Type[StubT]) -> StubT:
+        """Get a stub of the given class over this connection's channel, creating it on first use.
+
+        A stub holds nothing but the callables of its service's methods, so all the API objects of a connection share
+        one stub per service instead of building their own.
+
+        Raises:
+            QMConnectionError: if the connection has been closed
+        """
+        self.raise_if_closed()
+        stub = self._stubs.get(stub_class)
+        if stub is None:
+            stub = self._stubs[stub_class] = stub_class(self.channel)  # type: ignore[call-arg]
+        return stub  # type: ignore[no-any-return]
+
     def close(self) -> None:
         """Tear down the underlying gRPC channel and mark this connection unusable.
 
@@ -65,6 +83,7 @@ class ConnectionDetails:
         if self._closed:
             return
         self._closed = True
+        self._stubs.clear()
         if self._channel is not None:
             # Without unregister, atexit keeps a strong reference to
             # `channel.close` which transitively pins the channel and prevents GC.
@@ -19,6 +19,8 @@ class ResponseMessageTypeV2(Protocol[SuccessType]):
 
 
 class BaseApiV2(BaseApi[StubType], metaclass=ABCMeta):
+    __slots__ = ()
+
     def _run(
         self,
         grpc_method: Callable[..., ResponseMessageType],
@@ -1,5 +1,6 @@
 import logging
 import warnings
+import functools
 from dataclasses import dataclass
 from collections import defaultdict
 from typing import (
@@ -76,11 +77,20 @@ def transfer_statuses_to_enum(
     if isinstance(status, str):
         status = [status]
     try:
-        return sum([_INVERSE_JOB_STATUS_MAPPING[x] for x in status], [])
+        return list(_statuses_to_enum(tuple(status)))
     except KeyError:
         raise QmValueError(f"One ore more statuses is invalid: {status}")
 
 
+@functools.lru_cache(maxsize=32)
+def _statuses_to_enum(
+    statuses: Tuple[JobStatus, ...]
+) -> Tuple[common_types_pb2.JobExecutionStatus.ValueType, ...]:  # type: ignore[name-defined]
+    # Only a handful of status combinations are used in practice (e.g. no status, or just "In queue"), so the
+    # conversion is cached
+    return tuple(enum_value for x in statuses for enum_value in _INVERSE_JOB_STATUS_MAPPING[x])
+
+
 @overload
 def _extract_io_value_type(
     io_value: job_api_pb2.GetIoValuesResponse.GetIoValuesResponseSuccess.IOValuesData, io_type: None
@@ -1,6 +1,7 @@
 import logging
 import contextlib
 from typing import (
+    Dict,
     List,
     Type,
     Tuple,
@@ -20,8 +21,8 @@ from typing import (
 )
 
 from qm.type_hinting import Number
-from qm.utils import LOG_LEVEL_MAP
 from qm.octave import QmOctaveConfig
+from qm.utils import LOG_LEVEL_TABLE
 from qm.api.v2.base_api_v2 import BaseApiV2
 from qm.program import Program, load_config
 from qm.elements_db import init_octave_elements
@@ -41,6 +42,7 @@ from qm.program._fill_defaults_in_config_v1 import fill_defaults_in_config_v1
 from qm.octave.qm_octave import QmOctaveForNewApi, create_dc_offset_octave_update
 from qm.grpc.qm.pb import compiler_pb2, frontend_pb2, qm_manager_pb2, inc_qua_config_pb2
 from qm.api.v2.job_api.job_api import JobApi, JobData, JobStatus, transfer_statuses_to_enum
+from qm.program._dict_to_pb_converter.converters.mixer_correction_converter import MixerCorrectionConverter
 from qm.type_hinting.config_types import FullQuaConfig, MixerConfigType, LogicalQuaConfig, ControllerQuaConfig
 from qm.api.models.compiler import CompilerOptionArguments, standardize_compiler_params, get_request_compiler_options
 from qm.octave.octave_mixer_calibration import (
@@ -61,10 +63,20 @@ from qm.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# The compiler options sent when none are given are always the same, so they are converted once
+_DEFAULT_COMPILER_OPTIONS_PB = get_request_compiler_options(CompilerOptionArguments())
+
 
 def _log_messages(messages: MutableSequence[compiler_pb2.CompilerMessage]) -> None:
+    log, level_table = logger.log, LOG_LEVEL_TABLE
     for message in messages:
-        logger.log(LOG_LEVEL_MAP[message.level], message.message)
+        log(level_table[message.level], message.message)
+
+
+def _set_compiler_options(program: Program, compiler_options: Optional[CompilerOptionArguments]) -> None:
+    program.qua_program.compilerOptions.CopyFrom(
+        _DEFAULT_COMPILER_OPTIONS_PB if compiler_options is None else get_request_compiler_options(compiler_options)
+    )
 
 
 class ErrorResponseWithConfigValidationErrors(Protocol):
@@ -81,11 +93,12 @@ def get_formatted_errors(error: ErrorResponseWithConfigValidationErrors) -> str:
     else:
         # Check if the exception is due to some other reason
         error_messages = []
+        log, level_table = logger.log, LOG_LEVEL_TABLE
         for msg in error.messages:
-            lvl = LOG_LEVEL_MAP[msg.level]
+            lvl = level_table[msg.level]
             if lvl == logging.ERROR:
                 error_messages.append(msg.message)
-            logger.log(lvl, msg.message)
+            log(lvl, msg.message)
 
         return "\n".join(error_messages)
 
@@ -122,6 +135,21 @@ def handle_simulation_error() -> Generator[None, None, None]:
 
 
 class QmApi(BaseApiV2[QmServiceStub]):
+    __slots__ = (
+        "_caps",
+        "_id",
+        "_close_request",
+        "_reset_digital_filters_request",
+        "_get_config_request",
+        "_supports_config_v2",
+        "_supports_waveform_report",
+        "_supports_exp_dc_filter",
+        "_elements",
+        "_octave_manager",
+        "_octave",
+        "_octave_already_configured",
+    )
+
     SIMULATED_JOB_CLASS = SimulatedJobApi
 
     def __init__(
@@ -137,6 +165,15 @@ class QmApi(BaseApiV2[QmServiceStub]):
         super().__init__(connection_details)
         self._caps = capabilities
         self._id = qm_id
+        # The payload of these requests only depends on the QM id, so they are built once and reused
+        self._close_request = qm_api_pb2.QmServiceCloseRequest(quantum_machine_id=qm_id)
+        self._reset_digital_filters_request = qm_api_pb2.ResetDigitalFiltersRequest(quantum_machine_id=qm_id)
+        self._get_config_request = qm_api_pb2.QmServiceGetConfigRequest(quantum_machine_id=qm_id)
+        # The server capabilities don't change during the lifetime of the QM, so the ones checked on every call are
+        # resolved once here
+        self._supports_config_v2 = capabilities.supports(QopCaps.config_v2)
+        self._supports_waveform_report = capabilities.supports(QopCaps.waveform_report_endpoint)
+        self._supports_exp_dc_filter = capabilities.supports(QopCaps.exponential_dc_gain_filter)
         pb_config = pb_config or self._get_pb_config()
         self._elements = init_octave_elements(pb_config, capabilities, octave_config)
         self._octave_manager = octave_manager
@@ -156,12 +193,13 @@ class QmApi(BaseApiV2[QmServiceStub]):
     def _stub_class(self) -> Type[QmServiceStub]:
         return QmServiceStub
 
-    def _convert_config_param_to_pb(
-        self, config: Optional[Union[FullQuaConfig, LogicalQuaConfig]], function_name: str
+    def _prepare_program_config(
+        self, program: Program, config: Optional[Union[FullQuaConfig, LogicalQuaConfig]], function_name: str
     ) -> Optional[inc_qua_config_pb2.QuaConfig]:
         """
-        Validates the config_v2 capability and converts the config to proto format.
+        Validates the capabilities used by the program and converts the config sent with it to proto format.
         """
+        self._caps.validate(program.used_capabilities)
         if config:
             self._validate_capability_for_config_param(function_name)
             return self._load_config_with_exception_handling(config, function_name)
@@ -172,7 +210,7 @@ class QmApi(BaseApiV2[QmServiceStub]):
         Validates that there is a config_v2 capability, since only from config_v2 (QOP 3.5) it is possible to pass a
         config to the api functions (which use this function for validation).
         """
-        if not self._caps.supports(QopCaps.config_v2):
+        if not self._supports_config_v2:
             raise UnsupportedCapabilitiesError(
                 f"Passing a config to qm.{function_name}() is supported from QOP {QopCaps.config_v2.from_qop_version} and above."
             )
@@ -220,6 +258,21 @@ class QmApi(BaseApiV2[QmServiceStub]):
         Returns:
             A list of jobs
         """
+        return [
+            JobData.from_grpc(j)
+            for j in self._get_jobs_raw(job_ids=job_ids, user_ids=user_ids, description=description, status=status)
+        ]
+
+    def _get_jobs_raw(
+        self,
+        job_ids: Iterable[str] = tuple(),
+        user_ids: Iterable[str] = tuple(),
+        description: str = "",
+        status: Union[JobStatus, Iterable[JobStatus]] = tuple(),
+    ) -> Sequence[qmm_api_pb2.JobResponseData]:
+        """
+        Same as `get_jobs`, but returns the jobs as they were received from the server, without converting them.
+        """
         query_params = qmm_api_pb2.JobsQueryParams(
             quantum_machine_ids=[self._id],
             job_ids=list(job_ids),
@@ -227,13 +280,17 @@ class QmApi(BaseApiV2[QmServiceStub]):
             description=description,
             status=transfer_statuses_to_enum(status),
         )
+        return self._query_jobs(query_params)
+
+    def _query_jobs(self, query_params: qmm_api_pb2.JobsQueryParams) -> Sequence[qmm_api_pb2.JobResponseData]:
         request = qm_api_pb2.QmServiceGetJobsRequest(query=query_params)
         response: qmm_api_pb2.GetJobsSuccess = self._run(self._stub.GetJobs, request, timeout=self._timeout)
-        return [JobData.from_grpc(j) for j in response.jobs]
+        return response.jobs
 
     def _get_pb_config(self) -> inc_qua_config_pb2.QuaConfig:
-        request = qm_api_pb2.QmServiceGetConfigRequest(quantum_machine_id=self._id)
-        response: qm_api_pb2.GetConfigSuccess = self._run(self._stub.GetConfig, request, timeout=self._timeout)
+        response: qm_api_pb2.GetConfigSuccess = self._run(
+            self._stub.GetConfig, self._get_config_request, timeout=self._timeout
+        )
         config = response.config
         fill_defaults_in_config_v1(config)
         return config
@@ -275,13 +332,8 @@ class QmApi(BaseApiV2[QmServiceStub]):
             job.wait_until("running")
             ```
         """
-        self._caps.validate(program.used_capabilities)
-
-        pb_config = self._convert_config_param_to_pb(config, self.compile.__name__)
-
-        if compiler_options is None:
-            compiler_options = CompilerOptionArguments()
-        program.qua_program.compilerOptions.CopyFrom(get_request_compiler_options(compiler_options))
+        pb_config = self._prepare_program_config(program, config, self.compile.__name__)
+        _set_compiler_options(program, compiler_options)
         request = qm_api_pb2.QmServiceCompileRequest(
             quantum_machine_id=self._id, high_level_program=program.qua_program, config=pb_config
         )
@@ -350,23 +402,31 @@ class QmApi(BaseApiV2[QmServiceStub]):
         logger.info("Adding program to queue.")
 
         if isinstance(program, str):
-            if compiler_options:
-                raise ValueError("Cannot add compiler options to a compiled program.")
-            if config is not None:
-                raise ValueError("Cannot add a config to a compiled program.")
-            job = self._add_compiled(program)
+            job = self._add_compiled_program_id(program, config, compiler_options)
         else:
-            self._caps.validate(program.used_capabilities)
-            pb_config = self._convert_config_param_to_pb(config, self.add_to_queue.__name__)
-
-            if compiler_options is None:
-                compiler_options = CompilerOptionArguments()
-            program.qua_program.compilerOptions.CopyFrom(get_request_compiler_options(compiler_options))
+            pb_config = self._prepare_program_config(program, config, self.add_to_queue.__name__)
+            _set_compiler_options(program, compiler_options)
             job = self._add_program(program, pb_config)
 
-        logger.info(f"Program added to queue. Job id: {job.id}")
+        logger.info("Program added to queue. Job id: %s", job.id)
         return job
 
+    def _add_compiled_program_id(
+        self,
+        program_id: str,
+        config: Optional[Union[FullQuaConfig, LogicalQuaConfig]],
+        compiler_options: Optional[CompilerOptionArguments],
+    ) -> JobApi:
+        """
+        A compiled program already carries its config and compiler options, so none of the capability validation or
+        config conversion of a QUA program is needed here.
+        """
+        if compiler_options:
+            raise ValueError("Cannot add compiler options to a compiled program.")
+        if config is not None:
+            raise ValueError("Cannot add a config to a compiled program.")
+        return self._add_compiled(program_id)
+
     def get_job(self, job_id: str) -> JobApi:
         """
         Get a job based on the job_id.
@@ -377,12 +437,13 @@ class QmApi(BaseApiV2[QmServiceStub]):
         Returns:
             The job
         """
-        jobs_data = self.get_jobs(job_ids=[job_id])
+        # There is no endpoint for getting a single job, so the query is built with only the fields it filters by
+        jobs_data = self._query_jobs(qmm_api_pb2.JobsQueryParams(quantum_machine_ids=[self._id], job_ids=[job_id]))
         if not jobs_data:
             raise JobNotFoundException(job_id)
         else:
             job_data = jobs_data[0]
-            if self._caps.supports(QopCaps.waveform_report_endpoint) and job_data.is_simulation:
+            if self._supports_waveform_report and job_data.is_simulation:
                 return self._get_simulated_job(job_id)
 
             return self._get_job(job_id)
@@ -410,8 +471,8 @@ class QmApi(BaseApiV2[QmServiceStub]):
         """
         Creates a simulate request.
         """
+        pb_config = self._prepare_program_config(program, config, self.simulate.__name__)
         standardized_compiler_options = standardize_compiler_params(compiler_options, strict, flags)
-        pb_config = self._convert_config_param_to_pb(config, self.simulate.__name__)
 
         # We put self._get_pb_config() as the value for the config argument of create_simulation_request(), just
         # because we had to fill in something so it would work. We are not going to use that value, since in the new
@@ -458,8 +519,6 @@ class QmApi(BaseApiV2[QmServiceStub]):
         Returns:
             A ``QmJob`` object (see Job API).
         """
-        self._caps.validate(program.used_capabilities)
-
         logger.info("Simulating program.")
         request = self._create_simulate_request(
             program, simulate, compiler_options, config=config, strict=strict, flags=flags
@@ -534,9 +593,7 @@ class QmApi(BaseApiV2[QmServiceStub]):
         """
         Closes the quantum machine.
         """
-        self._run(
-            self._stub.Close, qm_api_pb2.QmServiceCloseRequest(quantum_machine_id=self._id), timeout=self._timeout
-        )
+        self._run(self._stub.Close, self._close_request, timeout=self._timeout)
 
     def get_queue_count(self) -> int:
         """
@@ -545,8 +602,8 @@ class QmApi(BaseApiV2[QmServiceStub]):
         Returns:
             The number of jobs in the queue
         """
-        jobs = self.get_jobs(status=["In queue"])
-        return len(jobs)
+        # The job data itself is not needed, so it is not converted
+        return len(self._get_jobs_raw(status=["In queue"]))
 
     def calibrate_element(
         self,
@@ -578,10 +635,12 @@ class QmApi(BaseApiV2[QmServiceStub]):
 
         inst_input = inst.input
         assert isinstance(inst_input, UpconvertedInputNewApi)
+        lo_frequency = inst_input.lo_frequency
+        port = inst_input.port
 
         if lo_if_dict is None:
-            lo_if_dict = {inst_input.lo_frequency: (inst.intermediate_frequency,)}
-        client = self._octave_manager._get_client_from_port(inst_input.port)
+            lo_if_dict = {lo_frequency: (inst.intermediate_frequency,)}
+        client = self._octave_manager._get_client_from_port(port)
         res = NewApiOctaveMixerCalibration(client=client, qm_api=self).calibrate(
             element=inst,
             lo_if_dict=lo_if_dict,
@@ -593,9 +652,9 @@ class QmApi(BaseApiV2[QmServiceStub]):
             if calibration_db is None:
                 logger.warning("No calibration db found, can't save results")
             else:
-                calibration_db.update_calibration_result(res, inst_input.port, "auto")
+                calibration_db.update_calibration_result(res, port, "auto")
 
-        key = (inst_input.lo_frequency, cast(float, inst_input.gain))
+        key = (lo_frequency, cast(float, inst_input.gain))
         if key in res:
             qe_cal = res[key]
             update: ControllerQuaConfig = {}
@@ -618,47 +677,53 @@ class QmApi(BaseApiV2[QmServiceStub]):
         frequency of the element is also added, in case it was updated as part of the calibration.
         """
         correction_entries = self._get_current_mixer_entries(inst_input.mixer)
-
-        for if_freq, if_cal in qe_cal.image.items():
-            self._upsert_correction_entry(correction_entries, if_freq, inst_input.lo_frequency, if_cal.fine.correction)
-
+        self._upsert_correction_entries(
+            correction_entries,
+            inst_input.lo_frequency,
+            {if_freq: if_cal.fine.correction for if_freq, if_cal in qe_cal.image.items()},
+        )
         return correction_entries
 
-    def _get_current_mixer_entries(self, mixer_name: str) -> List[MixerConfigType]:
-        current_config = self.get_config()
-        mixers = current_config.get("mixers", {})
-        return list(mixers.get(mixer_name, []))
-
-    def _upsert_correction_entry(
-        self,
+    @staticmethod
+    def _upsert_correction_entries(
         current_entries: List[MixerConfigType],
-        intermediate_frequency: Number,
         lo_frequency: Number,
-        values: Tuple[float, float, float, float],
+        corrections: Mapping[Number, Tuple[float, float, float, float]],
     ) -> None:
+        """
+        Upserts a correction entry for every (intermediate frequency, values) pair in `corrections`. The existing
+        entries are indexed once, so that all the given frequencies are upserted in a single pass.
+        """
+        entry_index: Dict[Tuple[Optional[Number], Optional[Number]], int] = {}
+        for i, e in enumerate(current_entries):
+            entry_index.setdefault((e.get("intermediate_frequency"), e.get("lo_frequency")), i)
+
+        for intermediate_frequency, values in corrections.items():
+            new_entry: MixerConfigType = {
+                "correction": values,
+                "intermediate_frequency": intermediate_frequency,
+                "lo_frequency": lo_frequency,
+            }
+            key = (intermediate_frequency, lo_frequency)
+            idx = entry_index.get(key)
+            if idx is None:
+                # Not present → append
+                entry_index[key] = len(current_entries)
+                current_entries.append(new_entry)
+            else:
+                # Present → replace
+                current_entries[idx] = new_entry
 
-        new_entry: MixerConfigType = {
-            "correction": values,
-            "intermediate_frequency": intermediate_frequency,
-            "lo_frequency": lo_frequency,
-        }
-
-        # Find an existing entry with the same intermediate_frequency and lo_frequency
-        idx = next(
-            (
-                i
-                for i, e in enumerate(current_entries)
-                if e.get("intermediate_frequency") == intermediate_frequency and e.get("lo_frequency") == lo_frequency
-            ),
-            None,
-        )
-
-        if idx is None:
-            # Not present → append
-            current_entries.append(new_entry)
-        else:
-            # Present → replace
-            current_entries[idx] = new_entry
+    def _get_current_mixer_entries(self, mixer_name: str) -> List[MixerConfigType]:
+        """
+        Fetches the current correction entries of a single mixer. Only the requested mixer is deconverted, rather than
+        the entire config.
+        """
+        mixers = get_controller_pb_config(self._get_pb_config()).mixers
+        if mixer_name not in mixers:
+            return []
+        converter = MixerCorrectionConverter(self._caps, init_mode=True)
+        return [converter.deconvert(entry) for entry in mixers[mixer_name].correction]
 
     def reset_digital_filters(self) -> None:
         """
@@ -666,16 +731,12 @@ class QmApi(BaseApiV2[QmServiceStub]):
         See [High-Pass Compensation Filter](../Guides/output_filter.md#high-pass-compensation-filter)
         for more information.
         """
-        if not self._caps.supports(QopCaps.exponential_dc_gain_filter):
+        if not self._supports_exp_dc_filter:
             raise UnsupportedCapabilitiesError(
                 f"qm.reset_digital_filters() is supported from QOP {QopCaps.exponential_dc_gain_filter.from_qop_version} and above."
             )
 
-        self._run(
-            self._stub.ResetDigitalFilters,
-            qm_api_pb2.ResetDigitalFiltersRequest(quantum_machine_id=self._id),
-            timeout=self._timeout,
-        )
+        self._run(self._stub.ResetDigitalFilters, self._reset_digital_filters_request, timeout=self._timeout)
 
 
 class NoRunningQmJob(Exception):
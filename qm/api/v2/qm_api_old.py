@@ -1,12 +1,11 @@
 import json
 import logging
-import warnings
-from typing import List, Tuple, Union, Literal, Optional, Sequence, MutableMapping, cast, overload
+from typing import Any, Dict, List, Tuple, Union, Literal, Optional, Sequence, MutableMapping, cast, overload
 
 from qm.api.v2.job_api import JobApi
 from qm.octave import QmOctaveConfig
 from qm.program.program import Program
-from qm.utils import deprecation_message
+from qm.grpc.qm.grpc.v2 import qmm_api_pb2
 from qm.exceptions import FunctionInputError
 from qm.grpc.qm.pb import inc_qua_config_pb2
 from qm.octave.octave_manager import OctaveManager
@@ -14,12 +13,13 @@ from qm.simulate.interface import SimulationConfig
 from qm.api.models.capabilities import ServerCapabilities
 from qm.api.models.server_details import ConnectionDetails
 from qm.api.v2.qm_api import QmApi, IoValue, NoRunningQmJob
-from qm.api.v2.job_api.job_api import JobApiWithDeprecations
 from qm.type_hinting import Value, Number, NumpySupportedValue
 from qm.type_hinting.general import PathLike, NumpySupportedFloat
+from qm.utils import warn_once, deprecated_method, deprecation_message
 from qm.jobs.job_queue_with_deprecations import QmQueueWithDeprecations
 from qm.api.v2.job_api.simulated_job_api import SimulatedJobApiWithDeprecations
 from qm.api.models.compiler import CompilerOptionArguments, standardize_compiler_params
+from qm.api.v2.job_api.job_api import JobApiWithDeprecations, transfer_statuses_to_enum
 from qm.type_hinting.config_types import FEM_IDX, FullQuaConfig, LogicalQuaConfig, ControllerQuaConfig
 from qm.utils.config_utils import (
     get_fem_config,
@@ -31,8 +31,203 @@ from qm.utils.config_utils import (
 logger = logging.getLogger(__name__)
 DEFAULT_EXECUTION_TIMEOUT = 5 * 60
 
+# The deprecated IO accessors look up the running job on every call, so its status filter is converted once
+_RUNNING_STATUS = transfer_statuses_to_enum("Running")
+
+_GET_JOB_BY_ID_DEPRECATION = deprecation_message(
+    method="qm.get_job_by_id",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, please use `qmm.get_job()`.",
+)
+_QUEUE_DEPRECATION = deprecation_message(
+    method="qm.queue",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This property is going to be removed, all functionality will exist directly under "
+    "`QuantumMachine`. For example, instead of `qm.queue.add(prog)` use `qm.add_to_queue(prog)`.",
+)
+_DURATION_LIMIT_ARGUMENT_DEPRECATION = deprecation_message(
+    method="The argument `duration_limit'", deprecated_in="1.2.0", removed_in="2.0.0"
+)
+_DATA_LIMIT_ARGUMENT_DEPRECATION = deprecation_message(
+    method="The argument `data_limit'", deprecated_in="1.2.0", removed_in="2.0.0"
+)
+_FORCE_EXECUTION_ARGUMENT_DEPRECATION = deprecation_message(
+    method="The argument `force_execution'", deprecated_in="1.2.0", removed_in="2.0.0"
+)
+_DRY_RUN_ARGUMENT_DEPRECATION = deprecation_message(
+    method="The argument `dry_run'", deprecated_in="1.2.0", removed_in="2.0.0"
+)
+_EXECUTE_SIMULATE_ARGUMENT_DEPRECATION = deprecation_message(
+    method="The argument simulate",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="The simulate argument is deprecated, please use the simulate method.",
+)
+_LIST_CONTROLLERS_DEPRECATION = deprecation_message(
+    method="qm.list_controllers",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, please get data from `qm.get_config()`.",
+)
+_SET_MIXER_CORRECTION_DEPRECATION = deprecation_message(
+    method="qm.set_mixer_correction",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, please use `job.set_element_correction()`.",
+)
+_SET_INTERMEDIATE_FREQUENCY_DEPRECATION = deprecation_message(
+    method="qm.set_intermediate_frequency",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.set_intermediate_frequency()`.",
+)
+_GET_INTERMEDIATE_FREQUENCY_DEPRECATION = deprecation_message(
+    method="qm.get_intermediate_frequency",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.get_intermediate_frequency()`.",
+)
+_GET_OUTPUT_DC_OFFSET_BY_ELEMENT_DEPRECATION = deprecation_message(
+    method="qm.get_output_dc_offset_by_element",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, please get idle value from `qm.get_config()`"
+    " or current value from job `job.get_output_dc_offset_by_element()`",
+)
+_SET_OUTPUT_DC_OFFSET_BY_ELEMENT_DEPRECATION = deprecation_message(
+    method="qm.set_output_dc_offset_by_element",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, please set idle value with `qm.update_config()`"
+    " or current value from job `job.set_output_dc_offset_by_element()`",
+)
+_SET_INPUT_DC_OFFSET_BY_ELEMENT_DEPRECATION = deprecation_message(
+    method="qm.set_input_dc_offset_by_element",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.set_input_dc_offset_by_element()`.",
+)
+_GET_INPUT_DC_OFFSET_BY_ELEMENT_DEPRECATION = deprecation_message(
+    method="qm.get_input_dc_offset_by_element",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, please get the value from `qm.get_config()`.",
+)
+_GET_DIGITAL_DELAY_DEPRECATION = deprecation_message(
+    method="qm.get_digital_delay",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.get_output_digital_delay()`.",
+)
+_SET_DIGITAL_DELAY_DEPRECATION = deprecation_message(
+    method="qm.set_digital_delay",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.set_output_digital_delay()`.",
+)
+_GET_DIGITAL_BUFFER_DEPRECATION = deprecation_message(
+    method="qm.get_digital_buffer",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.get_output_digital_buffer()`.",
+)
+_SET_DIGITAL_BUFFER_DEPRECATION = deprecation_message(
+    method="qm.set_digital_buffer",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.set_output_digital_buffer()`.",
+)
+_GET_TIME_OF_FLIGHT_DEPRECATION = deprecation_message(
+    method="qm.get_time_of_flight",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, please get the value from `qm.get_config()`.",
+)
+_GET_SMEARING_DEPRECATION = deprecation_message(
+    method="qm.get_smearing",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, please get the value from `qm.get_config()`.",
+)
+_IO1_DEPRECATION = deprecation_message(
+    method="qm.io1",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This property is going to be removed, please use `job.get_io_values()[0]`",
+)
+_IO1_SETTER_DEPRECATION = deprecation_message(
+    method="qm.io1",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This property is going to be removed, please use `job.set_io_values(io1=value)`",
+)
+_IO2_DEPRECATION = deprecation_message(
+    method="qm.io2",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This property is going to be removed, please use `job.get_io_values()[1]`",
+)
+_IO2_SETTER_DEPRECATION = deprecation_message(
+    method="qm.io2",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This property is going to be removed, please use `job.set_io_values(io2=value)`",
+)
+_SET_IO1_VALUE_DEPRECATION = deprecation_message(
+    method="qm.set_io1_value",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.set_io_values(io1=value)`",
+)
+_SET_IO2_VALUE_DEPRECATION = deprecation_message(
+    method="qm.set_io2_value",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.set_io_values(io2=value)`",
+)
+_SET_IO_VALUES_DEPRECATION = deprecation_message(
+    method="qm.set_io_values",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.set_io_values()`",
+)
+_GET_IO1_VALUE_DEPRECATION = deprecation_message(
+    method="qm.get_io1_value",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.get_io_values()[0]`",
+)
+_GET_IO2_VALUE_DEPRECATION = deprecation_message(
+    method="qm.get_io2_value",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.get_io_values()[1]`",
+)
+_GET_IO_VALUES_DEPRECATION = deprecation_message(
+    method="qm.get_io_values",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be moved to the job API, please use `job.get_io_values()`",
+)
+_SAVE_CONFIG_TO_FILE_DEPRECATION = deprecation_message(
+    method="qm.save_config_to_file",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed.",
+)
+_GET_RUNNING_JOB_DEPRECATION = deprecation_message(
+    method="qm.get_running_job",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, please use `qm.get_jobs(status=['Running'])`",
+)
+
 
 class QmApiWithDeprecations(QmApi):
+    __slots__ = ("_queue", "_running_job")
+
     SIMULATED_JOB_CLASS = SimulatedJobApiWithDeprecations
 
     def __init__(
@@ -44,8 +239,10 @@ class QmApiWithDeprecations(QmApi):
         octave_manager: OctaveManager,
         pb_config: Optional[inc_qua_config_pb2.QuaConfig] = None,
     ):
+        self._running_job: Optional[JobApiWithDeprecations] = None
         super().__init__(connection_details, qm_id, capabilities, octave_config, octave_manager, pb_config)
-        self._queue = QmQueueWithDeprecations(api=self, capabilities=self._caps)
+        # Created on first access, since the deprecated queue is not used with the new API
+        self._queue: Optional[QmQueueWithDeprecations] = None
 
     def _get_job(self, job_id: str) -> JobApiWithDeprecations:
         return JobApiWithDeprecations(self.connection_details, job_id, capabilities=self._caps)
@@ -62,16 +259,7 @@ class QmApiWithDeprecations(QmApi):
         Returns:
              The job object
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.get_job_by_id",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, please use `qmm.get_job()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_GET_JOB_BY_ID_DEPRECATION, DeprecationWarning, stacklevel=2)
         # The cast is needed to tell mypy (and pycharm) that the return type is JobApiWithDeprecations. Mypy thinks
         # the return type is JobApi because "get_job()" returns JobApi, even though the method "_get_job()" is
         # overridden in this class to return JobApiWithDeprecations.
@@ -80,17 +268,9 @@ class QmApiWithDeprecations(QmApi):
 
     @property
     def queue(self) -> QmQueueWithDeprecations:
-        warnings.warn(
-            deprecation_message(
-                method="qm.queue",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This property is going to be removed, all functionality will exist directly under "
-                "`QuantumMachine`. For example, instead of `qm.queue.add(prog)` use `qm.add_to_queue(prog)`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_QUEUE_DEPRECATION, DeprecationWarning, stacklevel=2)
+        if self._queue is None:
+            self._queue = QmQueueWithDeprecations(api=self, capabilities=self._caps)
         return self._queue
 
     def close(self) -> bool:  # type: ignore[override]
@@ -149,34 +329,22 @@ class QmApiWithDeprecations(QmApi):
         self._caps.validate(program.used_capabilities)
 
         if config:
-            self._validate_capability_for_config_param(self.execute.__name__)
-
-        for x, name in [
-            (duration_limit, "`duration_limit'"),
-            (data_limit, "`data_limit'"),
-            (force_execution, "`force_execution'"),
-            (dry_run, "`dry_run'"),
-        ]:
-            if x is not None:
-                warnings.warn(
-                    deprecation_message(
-                        method=f"The argument {name}",
-                        deprecated_in="1.2.0",
-                        removed_in="2.0.0",
-                    ),
-                )
-
-        compiler_options = standardize_compiler_params(compiler_options, strict, flags)
+            self._validate_capability_for_config_param("execute")
+
+        if duration_limit is not None:
+            warn_once(_DURATION_LIMIT_ARGUMENT_DEPRECATION, stacklevel=2)
+        if data_limit is not None:
+            warn_once(_DATA_LIMIT_ARGUMENT_DEPRECATION, stacklevel=2)
+        if force_execution is not None:
+            warn_once(_FORCE_EXECUTION_ARGUMENT_DEPRECATION, stacklevel=2)
+        if dry_run is not None:
+            warn_once(_DRY_RUN_ARGUMENT_DEPRECATION, stacklevel=2)
+
+        if strict is not None or flags is not None:
+            compiler_options = standardize_compiler_params(compiler_options, strict, flags)
 
         if simulate is not None:
-            warnings.warn(
-                deprecation_message(
-                    method="The argument simulate",
-                    deprecated_in="1.2.0",
-                    removed_in="2.0.0",
-                    details="The simulate argument is deprecated, please use the simulate method.",
-                ),
-            )
+            warn_once(_EXECUTE_SIMULATE_ARGUMENT_DEPRECATION, stacklevel=2)
             return self.simulate(program, simulate, compiler_options=compiler_options)
 
         logger.info("Clearing queue")
@@ -201,16 +369,7 @@ class QmApiWithDeprecations(QmApi):
         Returns:
             The names of the controllers configured in this qm
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.list_controllers",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, please get data from `qm.get_config()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_LIST_CONTROLLERS_DEPRECATION, DeprecationWarning, stacklevel=2)
         controller_config = get_controller_pb_config(self._get_pb_config())
         # This if statement is not necessary, but helps mypy understand that we are trying to access the controllers
         # attribute only if the controller_config is of type QuaConfigQuaConfigV1 (which still has the deprecated
@@ -237,7 +396,7 @@ class QmApiWithDeprecations(QmApi):
         corrections.
         """
         correction_entries = self._get_current_mixer_entries(mixer)
-        self._upsert_correction_entry(correction_entries, intermediate_frequency, lo_frequency, values)
+        self._upsert_correction_entries(correction_entries, lo_frequency, {intermediate_frequency: values})
         config_for_update: ControllerQuaConfig = {"mixers": {mixer: correction_entries}}
         self.update_config(config_for_update)
 
@@ -278,29 +437,14 @@ class QmApiWithDeprecations(QmApi):
             To change the calibration values for a running job,
             use job.set_element_correction
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.set_mixer_correction",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, please use `job.set_element_correction()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_SET_MIXER_CORRECTION_DEPRECATION, DeprecationWarning, stacklevel=2)
 
         self._upsert_mixer_correction_entry(mixer, intermediate_frequency, lo_frequency, values)
 
         job = self._get_running_job()
         if job is not None:
-            for name, element_config in self._get_elements_pb_config().items():
-                if not element_has_mix_inputs(element_config):
-                    continue
-                mixer_cond = element_config.mixInputs.mixer == mixer
-                if_cond = element_config.intermediateFrequency == intermediate_frequency
-                lo_cond = element_config.mixInputs.loFrequency == lo_frequency
-                if mixer_cond and if_cond and lo_cond:
-                    job.set_element_correction(name, values)
+            for name in self._get_elements_using_mixer(mixer, float(intermediate_frequency), float(lo_frequency)):
+                job.set_element_correction(name, values)
 
     def set_intermediate_frequency(self, element: str, freq: float) -> None:
         """
@@ -314,19 +458,8 @@ class QmApiWithDeprecations(QmApi):
             freq (float): the intermediate frequency to set to the given
                 element
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.set_intermediate_frequency",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use "
-                "`job.set_intermediate_frequency()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        job = self._strict_get_running_job()
-        job.set_intermediate_frequency(element, freq)
+        warn_once(_SET_INTERMEDIATE_FREQUENCY_DEPRECATION, DeprecationWarning, stacklevel=2)
+        self._strict_get_running_job().set_intermediate_frequency(element, freq)
 
     def get_intermediate_frequency(self, element: str) -> float:
         """
@@ -341,19 +474,8 @@ class QmApiWithDeprecations(QmApi):
         Returns:
             The intermediate frequency
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.get_intermediate_frequency",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use "
-                "`job.get_intermediate_frequency()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        job = self._strict_get_running_job()
-        return job.get_intermediate_frequency(element)
+        warn_once(_GET_INTERMEDIATE_FREQUENCY_DEPRECATION, DeprecationWarning, stacklevel=2)
+        return self._strict_get_running_job().get_intermediate_frequency(element)
 
     def get_output_dc_offset_by_element(
         self, element: str, iq_input: Optional[Literal["I", "Q", "single"]] = None
@@ -377,17 +499,7 @@ class QmApiWithDeprecations(QmApi):
         Returns:
             the offset, in volts
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.get_output_dc_offset_by_element",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, please get idle value from `qm.get_config()`"
-                " or current value from job `job.get_output_dc_offset_by_element()`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_GET_OUTPUT_DC_OFFSET_BY_ELEMENT_DEPRECATION, DeprecationWarning, stacklevel=2)
         job = self._strict_get_running_job()
         return job.get_output_dc_offset_by_element(element, iq_input)
 
@@ -441,48 +553,55 @@ class QmApiWithDeprecations(QmApi):
             If the sum of the DC offset and the largest waveform data-point exceed the range,
             DAC output overflow will occur and the output will be corrupted.
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.set_output_dc_offset_by_element",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, please set idle value with `qm.update_config()`"
-                " or current value from job `job.set_output_dc_offset_by_element()`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_SET_OUTPUT_DC_OFFSET_BY_ELEMENT_DEPRECATION, DeprecationWarning, stacklevel=2)
         if isinstance(input, str):
-            if not isinstance(offset, (int, float)):
-                raise FunctionInputError(f"Input should be int or float, got {type(offset)}")
-            if input in {"I", "Q"}:
-                ports = self._get_input_ports_from_mixed_input_element(element)
-                port = ports[0] if input == "I" else ports[1]
-            else:
-                port = self._get_input_port_from_single_input_element(element)
-            config = self._create_config_for_output_dc_offset_setting(port, offset)
-            self.update_config(config)
-            job = self._get_running_job()
-            if job is not None:
-                job.set_output_dc_offset_by_element(element, input, offset)
+            self._set_output_dc_offset_single(element, input, offset)
         elif isinstance(input, (list, tuple)):
-            if not set(input) <= {"I", "Q"}:
-                raise FunctionInputError(f"Input names should be 'I' or 'Q', got {input}")
-            if not (isinstance(offset, (list, tuple)) and len(input) == len(offset)):
-                raise FunctionInputError(
-                    f"input should be two iterables of the same size," f"got input = {input} and offset = {offset}"
-                )
-            ports = self._get_input_ports_from_mixed_input_element(element)
-            for _input, _offset in zip(input, offset):
-                _port = ports[0] if _input == "I" else ports[1]
-                config = self._create_config_for_output_dc_offset_setting(_port, _offset)
-                self.update_config(config)
-            job = self._get_running_job()
-            if job is not None:
-                job.set_output_dc_offset_by_element(element, input, offset)
+            self._set_output_dc_offset_pair(element, input, offset)
         else:
             raise FunctionInputError(f"Input should be str or tuple, got {type(input)}")
 
+    def _set_output_dc_offset_single(
+        self,
+        element: str,
+        input: Literal["single", "I", "Q"],
+        offset: Union[float, Tuple[float, float], List[float]],
+    ) -> None:
+        if not isinstance(offset, (int, float)):
+            raise FunctionInputError(f"Input should be int or float, got {type(offset)}")
+        if input == "I" or input == "Q":
+            ports = self._get_input_ports_from_mixed_input_element(element)
+            port = ports[0] if input == "I" else ports[1]
+        else:
+            port = self._get_input_port_from_single_input_element(element)
+        config = self._create_config_for_output_dc_offset_setting(port, offset)
+        self.update_config(config)
+        job = self._get_running_job()
+        if job is not None:
+            job.set_output_dc_offset_by_element(element, input, offset)
+
+    def _set_output_dc_offset_pair(
+        self,
+        element: str,
+        input: Union[Tuple[Literal["I", "Q"], Literal["I", "Q"]], List[Literal["I", "Q"]]],
+        offset: Union[float, Tuple[float, float], List[float]],
+    ) -> None:
+        if not all(_input in ("I", "Q") for _input in input):
+            raise FunctionInputError(f"Input names should be 'I' or 'Q', got {input}")
+        if not (isinstance(offset, (list, tuple)) and len(input) == len(offset)):
+            raise FunctionInputError(
+                f"input should be two iterables of the same size," f"got input = {input} and offset = {offset}"
+            )
+        ports = self._get_input_ports_from_mixed_input_element(element)
+        # All the offsets are sent in a single config update, instead of one update per port
+        config = self._create_config_for_output_dc_offsets_setting(
+            [(ports[0] if _input == "I" else ports[1], _offset) for _input, _offset in zip(input, offset)]
+        )
+        self.update_config(config)
+        job = self._get_running_job()
+        if job is not None:
+            job.set_output_dc_offset_by_element(element, input, offset)
+
     def set_output_filter_by_element(
         self,
         element: str,
@@ -509,17 +628,7 @@ class QmApiWithDeprecations(QmApi):
             If the sum of the DC offset and the largest waveform data-point exceed the range,
             DAC output overflow will occur and the output will be corrupted.
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.set_input_dc_offset_by_element",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use "
-                "`job.set_input_dc_offset_by_element()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_SET_INPUT_DC_OFFSET_BY_ELEMENT_DEPRECATION, DeprecationWarning, stacklevel=2)
         port = self._get_output_port_from_element(element, output)
         config = self._create_config_for_input_dc_offset_setting(port, offset)
         self.update_config(config)
@@ -541,16 +650,7 @@ class QmApiWithDeprecations(QmApi):
         Returns:
             The offset, in volts
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.get_input_dc_offset_by_element",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, please get the value from `qm.get_config()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_GET_INPUT_DC_OFFSET_BY_ELEMENT_DEPRECATION, DeprecationWarning, stacklevel=2)
         config = self._get_pb_config()
         port = self._get_output_port_from_element(element, output)
         fem_config = get_fem_config(config, port)
@@ -574,19 +674,8 @@ class QmApiWithDeprecations(QmApi):
         Returns:
             The delay
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.get_digital_delay",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use "
-                "`job.get_output_digital_delay()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        job = self._strict_get_running_job()
-        return job.get_output_digital_delay(element, digital_input)
+        warn_once(_GET_DIGITAL_DELAY_DEPRECATION, DeprecationWarning, stacklevel=2)
+        return self._strict_get_running_job().get_output_digital_delay(element, digital_input)
 
     def set_digital_delay(self, element: str, digital_input: str, delay: int) -> None:
         """Deprecated - This method is going to be moved to the job API, please use `job.set_output_digital_delay()`.
@@ -599,19 +688,8 @@ class QmApiWithDeprecations(QmApi):
                 the element's config
             delay (int): The delay value to set to, in ns.
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.set_digital_delay",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use "
-                "`job.set_output_digital_delay()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        job = self._strict_get_running_job()
-        job.set_output_digital_delay(element, digital_input, delay)
+        warn_once(_SET_DIGITAL_DELAY_DEPRECATION, DeprecationWarning, stacklevel=2)
+        self._strict_get_running_job().set_output_digital_delay(element, digital_input, delay)
 
     def get_digital_buffer(self, element: str, digital_input: str) -> int:
         """Deprecated - This method is going to be moved to the job API, please use `job.get_output_digital_buffer()`.
@@ -626,19 +704,8 @@ class QmApiWithDeprecations(QmApi):
         Returns:
             The buffer
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.get_digital_buffer",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use "
-                "`job.get_output_digital_buffer()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        job = self._strict_get_running_job()
-        return job.get_output_digital_buffer(element, digital_input)
+        warn_once(_GET_DIGITAL_BUFFER_DEPRECATION, DeprecationWarning, stacklevel=2)
+        return self._strict_get_running_job().get_output_digital_buffer(element, digital_input)
 
     def set_digital_buffer(self, element: str, digital_input: str, buffer: int) -> None:
         """Deprecated - This method is going to be moved to the job API, please use `job.set_output_digital_buffer()`.
@@ -651,19 +718,8 @@ class QmApiWithDeprecations(QmApi):
                 the element's config
             buffer (int): The buffer value to set to, in ns.
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.set_digital_buffer",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use "
-                "`job.set_output_digital_buffer()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        job = self._strict_get_running_job()
-        job.set_output_digital_buffer(element, digital_input, buffer)
+        warn_once(_SET_DIGITAL_BUFFER_DEPRECATION, DeprecationWarning, stacklevel=2)
+        self._strict_get_running_job().set_output_digital_buffer(element, digital_input, buffer)
 
     def get_time_of_flight(self, element: str) -> int:
         """Deprecated - This method is going to be removed, please get the value from `qm.get_config()`.
@@ -680,16 +736,7 @@ class QmApiWithDeprecations(QmApi):
         Returns:
             The time of flight, in ns
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.get_time_of_flight",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, please get the value from `qm.get_config()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_GET_TIME_OF_FLIGHT_DEPRECATION, DeprecationWarning, stacklevel=2)
         tof = self._get_elements_pb_config()[element].timeOfFlight
         if tof is None:
             raise ValueError(f"Time of flight for element {element} is not set")
@@ -710,16 +757,7 @@ class QmApiWithDeprecations(QmApi):
         Returns:
             The smearing, in ns.
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.get_smearing",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, please get the value from `qm.get_config()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_GET_SMEARING_DEPRECATION, DeprecationWarning, stacklevel=2)
         smearing = self._get_elements_pb_config()[element].smearing
         if smearing is None:
             raise ValueError(f"Smearing for element {element} is not set")
@@ -727,60 +765,25 @@ class QmApiWithDeprecations(QmApi):
 
     @property
     def io1(self) -> IoValue:
-        warnings.warn(
-            deprecation_message(
-                method="qm.io1",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This property is going to be removed, please use `job.get_io_values()[0]`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        return self.get_io1_value()
+        warn_once(_IO1_DEPRECATION, DeprecationWarning, stacklevel=2)
+        return self._get_io_values()[0]
 
     @io1.setter
     def io1(self, value: Value) -> None:
-        warnings.warn(
-            deprecation_message(
-                method="qm.io1",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This property is going to be removed, please use `job.set_io_values(io1=value)`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        self.set_io1_value(value)
+        warn_once(_IO1_SETTER_DEPRECATION, DeprecationWarning, stacklevel=2)
+        self._set_io_values(value_1=value)
 
     @property
     def io2(self) -> IoValue:
-        warnings.warn(
-            deprecation_message(
-                method="qm.io2",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This property is going to be removed, please use `job.get_io_values()[1]`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        return self.get_io1_value()
+        warn_once(_IO2_DEPRECATION, DeprecationWarning, stacklevel=2)
+        return self._get_io_values()[1]
 
     @io2.setter
     def io2(self, value: Value) -> None:
-        warnings.warn(
-            deprecation_message(
-                method="qm.io2",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This property is going to be removed, please use `job.set_io_values(io2=value)`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        self.set_io2_value(value)
+        warn_once(_IO2_SETTER_DEPRECATION, DeprecationWarning, stacklevel=2)
+        self._set_io_values(value_2=value)
 
+    @deprecated_method(_SET_IO1_VALUE_DEPRECATION)
     def set_io1_value(self, value_1: Value) -> None:
         """Deprecated - This method is going to be moved to the job API, please use `job.set_io_values(io1=value)`
 
@@ -797,18 +800,9 @@ class QmApiWithDeprecations(QmApi):
         Args:
             value_1: The value to be placed in ``IO1``
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.set_io1_value",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use `job.set_io_values(io1=value)`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        self.set_io_values(value_1=value_1)
+        self._set_io_values(value_1=value_1)
 
+    @deprecated_method(_SET_IO2_VALUE_DEPRECATION)
     def set_io2_value(self, value_2: Value) -> None:
         """Deprecated - This method is going to be moved to the job API, please use `job.set_io_values(io2=value)`
 
@@ -825,18 +819,9 @@ class QmApiWithDeprecations(QmApi):
         Args:
             value_2: The value to be placed in ``IO2``
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.set_io2_value",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use `job.set_io_values(io2=value)`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        self.set_io_values(value_2=value_2)
+        self._set_io_values(value_2=value_2)
 
+    @deprecated_method(_SET_IO_VALUES_DEPRECATION)
     def set_io_values(
         self,
         value_1: Optional[NumpySupportedValue] = None,
@@ -858,22 +843,18 @@ class QmApiWithDeprecations(QmApi):
             value_1: The value to be placed in ``IO1``
             value_2: The value to be placed in ``IO2``
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.set_io_values",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use `job.set_io_values()`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        self._set_io_values(value_1, value_2)
+
+    def _set_io_values(
+        self,
+        value_1: Optional[NumpySupportedValue] = None,
+        value_2: Optional[NumpySupportedValue] = None,
+    ) -> None:
         if value_1 is None and value_2 is None:
             return
+        self._strict_get_running_job().set_io_values(value_1, value_2)
 
-        job = self._strict_get_running_job()
-        job.set_io_values(value_1, value_2)
-
+    @deprecated_method(_GET_IO1_VALUE_DEPRECATION)
     def get_io1_value(self) -> IoValue:
         """Deprecated - This method is going to be moved to the job API, please use `job.get_io_values()[0]`
 
@@ -885,18 +866,9 @@ class QmApiWithDeprecations(QmApi):
             A dictionary with data stored in ``IO1``. (Data is in all
             three format: ``int``, ``float`` and ``bool``)
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.get_io2_value",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use `job.get_io_values()[0]`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        return self.get_io_values()[0]
+        return self._get_io_values()[0]
 
+    @deprecated_method(_GET_IO2_VALUE_DEPRECATION)
     def get_io2_value(self) -> IoValue:
         """Deprecated - This method is going to be moved to the job API, please use `job.get_io_values()[1]`
 
@@ -908,18 +880,9 @@ class QmApiWithDeprecations(QmApi):
             A dictionary with data stored in ``IO2``. (Data is in all
             three format: ``int``, ``float`` and ``bool``)
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.get_io2_value",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use `job.get_io_values()[1]`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        return self.get_io_values()[1]
+        return self._get_io_values()[1]
 
+    @deprecated_method(_GET_IO_VALUES_DEPRECATION)
     def get_io_values(self) -> List[IoValue]:
         """Deprecated - This method is going to be moved to the job API, please use `job.get_io_values()`
 
@@ -931,16 +894,9 @@ class QmApiWithDeprecations(QmApi):
             A dictionary with data stored in ``IO1`` & ``IO2`` (Data is in all
             three format: ``int``, ``float`` and ``bool``)
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.get_io_values",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be moved to the job API, please use `job.get_io_values()`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        return self._get_io_values()
+
+    def _get_io_values(self) -> List[IoValue]:
         running_job = self._strict_get_running_job()
         resp1, resp2 = running_job.get_io_values()
         return [
@@ -958,6 +914,7 @@ class QmApiWithDeprecations(QmApi):
             },
         ]
 
+    @deprecated_method(_SAVE_CONFIG_TO_FILE_DEPRECATION)
     def save_config_to_file(self, filename: PathLike) -> None:
         """Deprecated - This method is going to be removed.
 
@@ -966,41 +923,28 @@ class QmApiWithDeprecations(QmApi):
         Args:
             filename: The name of the file where the config will be saved
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.save_config_to_file",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        serialized = json.dumps(self.get_config(), separators=(",", ":"))
         with open(filename, "w") as writer:
-            json.dump(self.get_config(), writer)
+            writer.write(serialized)
 
+    @deprecated_method(_GET_RUNNING_JOB_DEPRECATION)
     def get_running_job(self) -> Optional[JobApiWithDeprecations]:
         """Deprecated - This method is going to be removed, please use `qm.get_jobs(status=['Running'])`
 
         Gets the currently running job. Returns None if there isn't one.
         """
-        warnings.warn(
-            deprecation_message(
-                method="qm.get_running_job",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, please use `qm.get_jobs(status=['Running'])`",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
         return self._get_running_job()
 
     def _get_running_job(self) -> Optional[JobApiWithDeprecations]:
-        jobs = self.get_jobs(status=["Running"])
-        if jobs:
-            return self._get_job(jobs[0].id)
-        return None
+        jobs = self._query_jobs(qmm_api_pb2.JobsQueryParams(quantum_machine_ids=[self._id], status=_RUNNING_STATUS))
+        if not jobs:
+            return None
+        job_id = jobs[0].job_id
+        # The query is repeated on every call, so a job that ended is never returned, but the job object is reused
+        # as long as the same job keeps running
+        if self._running_job is None or self._running_job.id != job_id:
+            self._running_job = self._get_job(job_id)
+        return self._running_job
 
     def _strict_get_running_job(self) -> JobApiWithDeprecations:
         job = self._get_running_job()
@@ -1029,6 +973,25 @@ class QmApiWithDeprecations(QmApi):
     def _get_elements_pb_config(self) -> MutableMapping[str, inc_qua_config_pb2.QuaConfig.ElementDec]:
         return get_logical_pb_config(self._get_pb_config()).elements
 
+    def _get_elements_using_mixer(self, mixer: str, intermediate_frequency: float, lo_frequency: float) -> List[str]:
+        """
+        Returns the names of the elements with mixer inputs that use the given mixer, intermediate and LO frequencies.
+        """
+        element_names = []
+        for name, element_config in self._get_elements_pb_config().items():
+            if not element_has_mix_inputs(element_config):
+                continue
+            mix_inputs = element_config.mixInputs
+            if mix_inputs.mixer != mixer:
+                continue
+            if_freq = element_config.intermediateFrequencyDouble or float(element_config.intermediateFrequency.value)
+            if element_config.intermediateFrequencyNegative:
+                if_freq = -if_freq
+            lo_freq = mix_inputs.loFrequencyDouble or float(mix_inputs.loFrequency)
+            if if_freq == intermediate_frequency and lo_freq == lo_frequency:
+                element_names.append(name)
+        return element_names
+
     @staticmethod
     def _create_config_for_input_dc_offset_setting(
         port: inc_qua_config_pb2.QuaConfig.AdcPortReference, value: Number
@@ -1054,3 +1017,14 @@ class QmApiWithDeprecations(QmApi):
                 }
             },
         }
+
+    @staticmethod
+    def _create_config_for_output_dc_offsets_setting(
+        offsets: Sequence[Tuple[inc_qua_config_pb2.QuaConfig.DacPortReference, Number]]
+    ) -> FullQuaConfig:
+        controllers: Dict[str, Any] = {}
+        for port, value in offsets:
+            fems = controllers.setdefault(port.controller, {"fems": {}})["fems"]
+            fem = fems.setdefault(cast(FEM_IDX, port.fem), {"type": "LF", "analog_outputs": {}})
+            fem["analog_outputs"][port.number] = {"offset": value}
+        return cast(FullQuaConfig, {"controllers": controllers})
@@ -1,7 +1,9 @@
 import logging
 import warnings
+import itertools
+from weakref import WeakValueDictionary
 from dataclasses import field, dataclass
-from typing import Dict, List, Type, Union, Literal, Mapping, Iterable, Optional, MutableSequence
+from typing import Dict, List, Type, Tuple, Union, Literal, Mapping, Iterable, Iterator, Optional, MutableSequence
 
 from qm.octave import QmOctaveConfig
 from qm.grpc.qm.grpc.v2 import qmm_api_pb2
@@ -22,7 +24,7 @@ from qm.api.v2.job_api.job_api import JobApi, JobData, JobStatus, JobApiWithDepr
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionResponse:
     gateway: str
     controllers: Dict[str, str]
@@ -31,9 +33,13 @@ class VersionResponse:
 ControllerTypes = Literal["OPX", "OPX1000"]
 FemTypes = Literal["LF", "MW"]
 FEM_TYPES_MAPPING: Dict[int, FemTypes] = {1: "LF", 2: "MW"}
+# Indexed by the FEM type enum value, 0 is an empty slot
+_FEM_TYPES_BY_VALUE: Tuple[Optional[FemTypes], ...] = tuple(
+    FEM_TYPES_MAPPING.get(value) for value in range(max(FEM_TYPES_MAPPING) + 1)
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class ControllerBase:
     name: str
 
@@ -42,7 +48,7 @@ class ControllerBase:
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True)
 class Controller(ControllerBase):
     _temperature: Optional[float] = field(repr=False)
 
@@ -60,7 +66,7 @@ class Controller(ControllerBase):
         return "OPX"
 
 
-@dataclass
+@dataclass(slots=True)
 class ControllerOPX1000(ControllerBase):
     hostname: str
     fems: Dict[int, FemTypes]
@@ -94,6 +100,8 @@ class QmmApi(BaseApiV2[QmmServiceStub]):
         self._caps = capabilities
         self._octave_config = octave_config
         self._octave_manager = octave_manager
+        # Jobs are looked up once and then shared for as long as the user holds a reference to them
+        self._job_cache: "WeakValueDictionary[str, JobApi]" = WeakValueDictionary()
 
     @property
     def _stub_class(self) -> Type[QmmServiceStub]:
@@ -111,15 +119,25 @@ class QmmApi(BaseApiV2[QmmServiceStub]):
         )
 
     def get_job(self, job_id: str) -> JobApi:
-        jobs_data = self.get_jobs(job_ids=[job_id])
-        if not jobs_data:
+        cached_job = self._job_cache.get(job_id)
+        if cached_job is not None:
+            return cached_job
+
+        job_data = self.get_jobs_by_ids([job_id]).get(job_id)
+        if job_data is None:
             raise JobNotFoundException(job_id)
-        else:
-            job_data = jobs_data[0]
-            if self._caps.supports(QopCaps.waveform_report_endpoint) and job_data.is_simulation:
-                return self._get_simulated_job(job_id)
+        if self._caps.supports(QopCaps.waveform_report_endpoint) and job_data.is_simulation:
+            return self._get_simulated_job(job_id)
+
+        job = self.JOB_CLASS(self.connection_details, job_id, capabilities=self._caps)
+        self._job_cache[job_id] = job
+        return job
 
-            return self.JOB_CLASS(self.connection_details, job_id, capabilities=self._caps)
+    def get_jobs_by_ids(self, job_ids: Iterable[str]) -> Dict[str, JobData]:
+        """
+        Gets the data of several jobs in a single request. Ids of jobs that were not found are missing from the result.
+        """
+        return {job_data.id: job_data for job_data in self.iter_jobs(job_ids=job_ids)}
 
     def get_jobs(
         self,
@@ -129,16 +147,33 @@ class QmmApi(BaseApiV2[QmmServiceStub]):
         description: str = "",
         status: Union[JobStatus, Iterable[JobStatus]] = tuple(),
     ) -> List[JobData]:
-        query_params = qmm_api_pb2.JobsQueryParams(
-            quantum_machine_ids=list(qm_ids),
-            job_ids=list(job_ids),
-            user_ids=list(user_ids),
-            description=description,
-            status=transfer_statuses_to_enum(status),
+        return list(
+            self.iter_jobs(qm_ids=qm_ids, job_ids=job_ids, user_ids=user_ids, description=description, status=status)
         )
-        request = qmm_api_pb2.GetJobsRequest(query=query_params)
+
+    def iter_jobs(
+        self,
+        qm_ids: Iterable[str] = tuple(),
+        job_ids: Iterable[str] = tuple(),
+        user_ids: Iterable[str] = tuple(),
+        description: str = "",
+        status: Union[JobStatus, Iterable[JobStatus]] = tuple(),
+    ) -> Iterator[JobData]:
+        """
+        Same as `get_jobs`, but the jobs are converted only as they are iterated over. The request itself is sent when
+        this method is called, so errors are raised here and not during the iteration.
+        """
+        # The query is filled in place, so it is not built separately and then copied into the request
+        request = qmm_api_pb2.GetJobsRequest()
+        query_params = request.query
+        query_params.SetInParent()
+        query_params.quantum_machine_ids.extend(qm_ids)
+        query_params.job_ids.extend(job_ids)
+        query_params.user_ids.extend(user_ids)
+        query_params.description = description
+        query_params.status.extend(transfer_statuses_to_enum(status))
         response: qmm_api_pb2.GetJobsSuccess = self._run(self._stub.GetJobs, request, timeout=self._timeout)
-        return [JobData.from_grpc(j) for j in response.jobs]
+        return map(JobData.from_grpc, response.jobs)
 
     def open_qm(self, config: inc_qua_config_pb2.QuaConfig, close_other_machines: Optional[bool] = None) -> QmApi:
         if close_other_machines is None:
@@ -165,9 +200,9 @@ class QmmApi(BaseApiV2[QmmServiceStub]):
             error = e.error
             open_qm_exception = OpenQmException(error.config_validation_errors, error.physical_validation_errors)
 
-            for formatted_error in (
-                open_qm_exception.physical_validation_formatted_errors
-                + open_qm_exception.config_validation_formatted_errors
+            for formatted_error in itertools.chain(
+                open_qm_exception.physical_validation_formatted_errors,
+                open_qm_exception.config_validation_formatted_errors,
             ):
                 logger.error(formatted_error)
 
@@ -176,7 +211,7 @@ class QmmApi(BaseApiV2[QmmServiceStub]):
         for warning in response.open_qm_warnings:
             logger.warning(f"Open QM ended with warning {warning.code}: {warning.message}")
 
-        logger.info("Opened quantum machine with id: " + response.quantum_machine_id)
+        logger.info("Opened quantum machine with id: %s", response.quantum_machine_id)
 
         return self.get_qm(response.quantum_machine_id, _pb_config=config)
 
@@ -185,11 +220,11 @@ class QmmApi(BaseApiV2[QmmServiceStub]):
         response: qmm_api_pb2.HealthCheckResponse.HealthCheckResponseSuccess = self._run(
             self._stub.HealthCheck, qmm_api_pb2.HealthCheckRequest(), timeout=self._timeout
         )
+        if not logger.isEnabledFor(logging.INFO):
+            return
         msg = "Cluster healthcheck completed successfully."
         if response.details:
-            msg += " Details:"
-            for k, v in response.details.items():
-                msg += f"\n  {k}: {v}"
+            msg += " Details:" + "".join(f"\n  {k}: {v}" for k, v in response.details.items())
         logger.info(msg)
 
     def get_version(self) -> VersionResponse:
@@ -198,7 +233,7 @@ class QmmApi(BaseApiV2[QmmServiceStub]):
         )
         return VersionResponse(
             gateway=response.gateway,
-            controllers={k: v for k, v in response.controllers.items()},
+            controllers=dict(response.controllers),
         )
 
     def get_controllers(self) -> Mapping[str, ControllerBase]:
@@ -207,19 +242,19 @@ class QmmApi(BaseApiV2[QmmServiceStub]):
         )
         to_return = {}
         correction_offset = 0 if self._caps.supports(QopCaps.opx1000_fems_return_1_based) else 1
+        supports_temperatures = self._caps.supports(QopCaps.device_temperatures)
+        fem_types = _FEM_TYPES_BY_VALUE
         for name, value in response.control_devices.items():
             if value.controller_type == 1:
                 to_return[name] = ControllerOPX1000(
                     name=name,
                     hostname=value.hostname,
                     fems={
-                        int(i) + correction_offset: FEM_TYPES_MAPPING[f.type]
+                        int(i) + correction_offset: fem_type
                         for i, f in value.fems.items()
-                        if f.type > 0
+                        if (fem_type := fem_types[f.type]) is not None
                     },
-                    _temperatures=proto_map_to_dict(value.temperatures)
-                    if self._caps.supports(QopCaps.device_temperatures)
-                    else None,
+                    _temperatures=proto_map_to_dict(value.temperatures) if supports_temperatures else None,
                 )
             else:
                 raise NotImplementedError(f"Controller type {value.controller_type} is not supported.")
@@ -235,9 +270,11 @@ class QmmApi(BaseApiV2[QmmServiceStub]):
     def _get_simulated_job(
         self, job_id: str, simulated: Union[frontend_pb2.SimulatedResponsePart, None] = None
     ) -> SimulatedJobApi:
-        return self.QM_CLASS.SIMULATED_JOB_CLASS(
+        job = self.QM_CLASS.SIMULATED_JOB_CLASS(
             self.connection_details, job_id, simulated_response=simulated, capabilities=self._caps
         )
+        self._job_cache[job_id] = job
+        return job
 
     def simulate(
         self,
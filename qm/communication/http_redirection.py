@@ -1,4 +1,6 @@
+import os
 import re
+import atexit
 import logging
 from typing import Dict, Tuple
 
@@ -11,9 +13,20 @@ from qm.exceptions import QmRedirectionError, QmLocationParsingError
 
 logger = logging.getLogger(__name__)
 
+_GRPC_HEADERS: Dict[str, str] = {"content-type": "application/grpc", "te": "trailers"}
+
+
+_LOCATION_PATTERN = re.compile("(?P<host>[^:]*):(?P<port>[0-9]*)(/(?P<url>.*))?")
+
 
 def _parse_location(location_header: str) -> Tuple[str, int]:
-    match = re.match("(?P<host>[^:]*):(?P<port>[0-9]*)(/(?P<url>.*))?", location_header)
+    # Fast path for the usual "host:port[/url]" header, the pattern handles everything else
+    host, _, rest = location_header.partition(":")
+    port_str = rest.partition("/")[0]
+    if host and port_str.isascii() and port_str.isdigit():
+        return host, int(port_str)
+
+    match = _LOCATION_PATTERN.match(location_header)
     if match is None:
         raise QmLocationParsingError(f"Could not parse new host and port (location header: {location_header})")
     host, port, _, __ = match.groups()
@@ -23,22 +36,24 @@ def _parse_location(location_header: str) -> Tuple[str, int]:
 
 
 def parse_octaves(raw_response: str) -> Dict[str, Tuple[str, int]]:
-    octaves = {}
+    octaves: Dict[str, Tuple[str, int]] = {}
+    if not raw_response:
+        return octaves
     for octave_details in raw_response.split(";"):
         if octave_details:
-            name_and_location = octave_details.split(",")
-            if len(name_and_location) != 2:
+            name, sep, location = octave_details.partition(",")
+            if not sep or "," in location:
                 raise QmLocationParsingError(
                     f"Could not parse octave name and location from '{octave_details}' (raw response: {raw_response})"
                 )
-            octaves[name_and_location[0]] = _parse_location(name_and_location[1])
+            octaves[name] = _parse_location(location)
     return octaves
 
 
 def send_redirection_check(
     host: str, port: int, headers: Dict[str, str], timeout: float, async_follow_redirects: bool, async_trust_env: bool
 ) -> ResponseConnectionDetails:
-    extended_headers = {"content-type": "application/grpc", "te": "trailers", **headers}
+    extended_headers = _GRPC_HEADERS | headers
     response = _get_httpx_response(
         f"http://{host}:{port}", extended_headers, timeout, async_follow_redirects, async_trust_env
     )
@@ -57,11 +72,44 @@ def send_redirection_check(
     return ResponseConnectionDetails(new_host, new_port, octaves)
 
 
+_httpx_clients: Dict[Tuple[int, float, bool, bool], httpx.Client] = {}
+
+
+def _close_httpx_clients() -> None:
+    for client in _httpx_clients.values():
+        client.close()
+    _httpx_clients.clear()
+
+
+atexit.register(_close_httpx_clients)
+
+
 def _get_httpx_response(
     url: str, headers: Dict[str, str], timeout: float, follow_redirects: bool, trust_env: bool
 ) -> Response:
-    with httpx.Client(
+    content = Empty().SerializeToString()
+    key = (os.getpid(), timeout, follow_redirects, trust_env)
+    client = _httpx_clients.get(key)
+    if client is not None:
+        try:
+            return client.post(url, headers=headers, content=content)
+        except (httpx.RemoteProtocolError, httpx.ReadError) as e:
+            # A pooled connection may be stale (e.g. the gateway was restarted), so retry once with a new client.
+            # Other errors (e.g. a refused connection) would fail the same way again, so they are not retried.
+            logger.debug("Redirection check to %s failed (%s), retrying with a new connection", url, e)
+            client.close()
+    client = _httpx_clients[key] = _create_httpx_client(timeout, follow_redirects, trust_env)
+    return client.post(url, headers=headers, content=content)
+
+
+def _create_httpx_client(timeout: float, follow_redirects: bool, trust_env: bool) -> httpx.Client:
+    """
+    The clients are kept for the lifetime of the process, so detecting the server on several ports (or for several
+    managers) reuses their connection pool instead of setting up a new one every time.
+    Note that the proxy settings taken from the environment (when trust_env is set) are frozen when a client is
+    created, later changes to them only apply after the client is renewed.
+    The cache is keyed by the process id too, so a forked process never shares its parent's connections.
+    """
+    return httpx.Client(
         http2=True, follow_redirects=follow_redirects, http1=False, timeout=timeout, trust_env=trust_env
-    ) as client:
-        response = client.post(url, headers=headers, content=Empty().SerializeToString())
-    return response
+    )
@@ -10,6 +10,10 @@ from qm.type_hinting.general import NumpySupportedFloat, NumpySupportedNumber
 
 logger = logging.getLogger(__name__)
 
+# Correction matrix entries must lie in (-2, 2 - 2 ** (-16)]
+_MIN_CORRECTION_VALUE = -2
+_MAX_CORRECTION_VALUE = 2 - 2 ** (-16)
+
 
 def _set_single_output_port_dc_offset(
     frontend_api: FrontendApi,
@@ -19,7 +23,7 @@ def _set_single_output_port_dc_offset(
     offset: NumpySupportedNumber,
 ) -> None:
     offset = float(offset)
-    logger.debug(f"Setting DC offset of input '{input_name}' on element '{element_name}' to '{offset}'")
+    logger.debug("Setting DC offset of input '%s' on element '%s' to '%s'", input_name, element_name, offset)
     frontend_api.set_output_dc_offset(machine_id, element_name, input_name, offset)
 
 
@@ -32,7 +36,11 @@ def _create_taps_filter(
     for name, instance in zip(["feedforward", "feedback"], [feedforward, feedback]):
         if not isinstance(instance, (numpy.ndarray, list)):
             raise TypeError(f"{name} must be a list, or a numpy array. Got {type(instance)}.")
-    return AnalogOutputPortFilter(feedforward=[float(x) for x in feedforward], feedback=[float(x) for x in feedback])
+    # Converting through a float64 array lets numpy produce the python floats in a single C loop
+    return AnalogOutputPortFilter(
+        feedforward=numpy.asarray(feedforward, dtype=numpy.float64).tolist(),
+        feedback=numpy.asarray(feedback, dtype=numpy.float64).tolist(),
+    )
 
 
 def static_set_mixer_correction(
@@ -51,7 +59,7 @@ def static_set_mixer_correction(
         raise Exception("correction values must have 4 items")
 
     float_values = [float(x) for x in values]
-    if not all((-2 < x <= (2 - 2 ** (-16))) for x in float_values):
+    if not all(_MIN_CORRECTION_VALUE < x <= _MAX_CORRECTION_VALUE for x in float_values):
         logger.warning(
             "At least one of the correction values are out of range. "
             f"values should be between -2 and 2 - 2 ** (-16), got {float_values}. "
@@ -62,17 +70,18 @@ def static_set_mixer_correction(
         v00=float_values[0], v01=float_values[1], v10=float_values[2], v11=float_values[3]
     )
 
+    abs_intermediate_frequency = abs(float(intermediate_frequency))
     mixer_lo_frequency_double = 0.0
     mixer_intermediate_frequency_double = 0.0
     if set_frequency_as_double:
         mixer_lo_frequency_double = float(lo_frequency)
-        mixer_intermediate_frequency_double = abs(float(intermediate_frequency))
+        mixer_intermediate_frequency_double = abs_intermediate_frequency
 
     mixer_info = MixerInfo(
         mixer=mixer,
         frequency_negative=bool(intermediate_frequency < 0),
         lo_frequency=int(lo_frequency),
-        intermediate_frequency=abs(int(intermediate_frequency)),
+        intermediate_frequency=int(abs_intermediate_frequency),
         lo_frequency_double=mixer_lo_frequency_double,
         intermediate_frequency_double=mixer_intermediate_frequency_double,
     )
@@ -162,7 +171,7 @@ class MixInputs(ElementInput[inc_qua_config_pb2.QuaConfig.MixInputs]):
 
     def _set_config_lo_frequency(self, value: float) -> None:
         freq = float(value)
-        logger.debug(f"Setting element '{self._name}' LO frequency to '{freq}'.")
+        logger.debug("Setting element '%s' LO frequency to '%s'.", self._name, freq)
         self._config.loFrequency = int(freq)
         self._config.loFrequencyDouble = 0.0
         if self._set_frequency_as_double:
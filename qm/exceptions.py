@@ -1,8 +1,9 @@
+import functools
 from pprint import pformat
 from collections import defaultdict
 from collections.abc import Collection
 from abc import ABCMeta, abstractmethod
-from typing import Any, List, Generic, TypeVar, Sequence
+from typing import Any, List, Tuple, Generic, TypeVar, Sequence
 
 from marshmallow import ValidationError
 from google.protobuf.message import Message
@@ -52,18 +53,25 @@ class OpenQmException(QmQuaException):
         config_validation_errors: Sequence[qm_manager_pb2.ConfigValidationMessage],
         physical_validation_errors: Sequence[qm_manager_pb2.PhysicalValidationMessage],
     ):
-        self.config_validation_formatted_errors = QopConfigValidationError(
-            config_validation_errors
-        ).validation_formatted_errors
-        self.physical_validation_formatted_errors = QopPhysicalValidationError(
-            physical_validation_errors
-        ).validation_formatted_errors
+        self._config_validation_error = QopConfigValidationError(config_validation_errors)
+        self._physical_validation_error = QopPhysicalValidationError(physical_validation_errors)
 
-    def __str__(self) -> str:
-        config_validation_error_message = "\n".join(self.config_validation_formatted_errors)
-        physical_validation_error_message = "\n".join(self.physical_validation_formatted_errors)
+    @property
+    def config_validation_formatted_errors(self) -> List[str]:
+        return self._config_validation_error.validation_formatted_errors
 
-        return f"Can not open QM, see the following errors:\n{config_validation_error_message}\n{physical_validation_error_message}"
+    @property
+    def physical_validation_formatted_errors(self) -> List[str]:
+        return self._physical_validation_error.validation_formatted_errors
+
+    def __str__(self) -> str:
+        return "\n".join(
+            [
+                "Can not open QM, see the following errors:",
+                *self.config_validation_formatted_errors,
+                *self.physical_validation_formatted_errors,
+            ]
+        )
 
 
 class FailedToExecuteJobException(QmQuaException):
@@ -89,11 +97,10 @@ class JobFailedError(QmQuaException):
 class ErrorJobStateError(QmQuaException):
     def __init__(self, *args: Any, error_list: List[str]):
         super().__init__(*args)
-        self._error_list = error_list if error_list else []
+        self._error_list: Tuple[str, ...] = tuple(error_list) if error_list else ()
 
     def __str__(self) -> str:
-        errors_string = "\n".join(error for error in self._error_list)
-        return f"{super().__str__()}\n{errors_string}"
+        return "\n".join([super().__str__(), *self._error_list])
 
 
 class UnknownJobStateError(QmQuaException):
@@ -320,7 +327,13 @@ ValidationType = TypeVar(
 
 class QopValidationError(QmQuaException, Generic[ValidationType], metaclass=ABCMeta):
     def __init__(self, validation_errors: Sequence[ValidationType]):
-        self.validation_formatted_errors = self._format_validation_errors(validation_errors)
+        self._validation_errors: Tuple[ValidationType, ...] = tuple(validation_errors)
+
+    @functools.cached_property
+    def validation_formatted_errors(self) -> List[str]:
+        # The messages are formatted only when they are first needed, exceptions that are caught and discarded never
+        # pay for it
+        return self._format_validation_errors(self._validation_errors)
 
     @property
     @abstractmethod
@@ -328,12 +341,11 @@ class QopValidationError(QmQuaException, Generic[ValidationType], metaclass=ABCM
         pass
 
     def _format_validation_errors(self, validation_errors: Sequence[ValidationType]) -> List[str]:
-        error_messages = []
-        for sub_error in validation_errors:
-            error_messages.append(
-                f'{self.error_type} in key "{sub_error.path}" [{sub_error.group}] : {sub_error.message}'
-            )
-        return error_messages
+        error_type = self.error_type
+        return [
+            f'{error_type} in key "{sub_error.path}" [{sub_error.group}] : {sub_error.message}'
+            for sub_error in validation_errors
+        ]
 
     def __str__(self) -> str:
         return "\n".join(self.validation_formatted_errors)
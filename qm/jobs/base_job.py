@@ -1,16 +1,25 @@
 import datetime
-import warnings
 from typing import List, Optional
 
 from qm.type_hinting import Value
 from qm.grpc.qm.pb import frontend_pb2
 from qm.exceptions import QmQuaException
-from qm.utils import deprecation_message
 from qm.api.frontend_api import FrontendApi
+from qm.utils import warn_once, deprecation_message
 from qm.api.job_manager_api import create_job_manager_from_api
 from qm.api.models.capabilities import QopCaps, ServerCapabilities
 from qm.utils.protobuf_utils import which_one_of, timestamp_to_datetime
 
+_INSERT_INPUT_STREAM_DEPRECATION = deprecation_message(
+    method="job.insert_input_stream",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method was renamed to `job.push_to_input_stream`.",
+)
+
+# The job states that carry who added the job and when
+_STATES_WITH_ADDITION_INFO = frozenset({"pending", "running", "completed", "loading"})
+
 
 class QmBaseJob:
     def __init__(
@@ -19,31 +28,27 @@ class QmBaseJob:
         machine_id: str,
         frontend_api: FrontendApi,
         capabilities: ServerCapabilities,
+        initial_status: Optional[frontend_pb2.JobExecutionStatus] = None,
     ):
         self._id = job_id
         self._machine_id = machine_id
         self._frontend = frontend_api
         self._capabilities = capabilities
+        # Input streams may be pushed to in a tight loop, so the capability is checked once
+        self._supports_input_stream = capabilities.supports(QopCaps.input_stream)
 
         self._job_manager = create_job_manager_from_api(frontend_api, capabilities)
 
         self._added_user_id: Optional[str] = None
         self._time_added: Optional[datetime.datetime] = None
-        self._initialize_from_job_status()
-
-    def _initialize_from_job_status(self) -> None:
-        status: frontend_pb2.JobExecutionStatus = self._job_manager.get_job_execution_status(self._id, self._machine_id)
-        _, job_state = which_one_of(status, "status")
-
-        if isinstance(
-            job_state,
-            (
-                frontend_pb2.JobExecutionStatus.Pending,
-                frontend_pb2.JobExecutionStatus.Running,
-                frontend_pb2.JobExecutionStatus.Completed,
-                frontend_pb2.JobExecutionStatus.Loading,
-            ),
-        ):
+        self._initialize_from_job_status(initial_status)
+
+    def _initialize_from_job_status(self, status: Optional[frontend_pb2.JobExecutionStatus] = None) -> None:
+        # Callers that have just fetched the job's status pass it, saving a second request for the same data
+        if status is None:
+            status = self._job_manager.get_job_execution_status(self._id, self._machine_id)
+        state_name, job_state = which_one_of(status, "status")
+        if job_state is not None and state_name in _STATES_WITH_ADDITION_INFO:
             self._added_user_id = job_state.addedBy
             self._time_added = timestamp_to_datetime(job_state.timeAdded)
 
@@ -83,16 +88,7 @@ class QmBaseJob:
         data: List[Value],
     ) -> None:
         """Deprecated - Please use `job.push_to_input_stream`."""
-        warnings.warn(
-            deprecation_message(
-                method="job.insert_input_stream",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method was renamed to `job.push_to_input_stream`.",
-            ),
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        warn_once(_INSERT_INPUT_STREAM_DEPRECATION, DeprecationWarning, stacklevel=2)
         self.push_to_input_stream(name, data)
 
     def push_to_input_stream(self, name: str, data: List[Value]) -> None:
@@ -111,7 +107,7 @@ class QmBaseJob:
             data: The data to be inserted. The data's size must match
                 the size of the input stream.
         """
-        if not self._capabilities.supports(QopCaps.input_stream):
+        if not self._supports_input_stream:
             raise QmQuaException("`push_to_input_stream()` is not supported by the QOP version.")
 
         if not isinstance(data, list):
@@ -1,17 +1,58 @@
 import logging
-import warnings
 from typing import TYPE_CHECKING, Tuple, Optional
 
 from qm.api.v2.job_api import JobApi
 from qm.program.program import Program
-from qm.utils import deprecation_message
 from qm.jobs.job_queue_base import QmQueueBase
+from qm.utils import warn_once, deprecation_message
 from qm.api.models.capabilities import ServerCapabilities
 from qm.api.models.compiler import CompilerOptionArguments
 from qm.api.v2.job_api.job_api import JobApiWithDeprecations
 
 logger = logging.getLogger(__name__)
 
+_PENDING_JOBS_DEPRECATION = deprecation_message(
+    method="queue.pending_jobs",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details='This property is going to be removed, use qm.get_jobs("In queue").',
+)
+
+_ADD_DEPRECATION = deprecation_message(
+    method="queue.add",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, use qm.add_to_queue.",
+)
+
+_ADD_COMPILED_DEPRECATION = deprecation_message(
+    method="queue.add_compiled",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, use `qm.add_to_queue()`.",
+)
+
+_REMOVE_BY_ID_DEPRECATION = deprecation_message(
+    method="queue.remove_by_id",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, use qm.clear_queue(user_ids=[user_id]) or job.cancel().",
+)
+
+_REMOVE_BY_USER_ID_DEPRECATION = deprecation_message(
+    method="queue.remove_by_user_id",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, use qm.clear_queue(user_ids=[user_id]) or job.cancel().",
+)
+
+_CLEAR_DEPRECATION = deprecation_message(
+    method="queue.clear",
+    deprecated_in="1.2.0",
+    removed_in="2.0.0",
+    details="This method is going to be removed, use qm.clear_queue.",
+)
+
 
 if TYPE_CHECKING:
     from qm.api.v2.qm_api_old import QmApiWithDeprecations
@@ -24,16 +65,7 @@ class QmQueueWithDeprecations(QmQueueBase[JobApi]):
 
     @property
     def pending_jobs(self) -> Tuple[JobApiWithDeprecations, ...]:
-        warnings.warn(
-            deprecation_message(
-                method="queue.pending_jobs",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details='This property is going to be removed, use qm.get_jobs("In queue").',
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_PENDING_JOBS_DEPRECATION, DeprecationWarning, stacklevel=2)
         return self._get_pending_jobs()
 
     def _get_pending_jobs(
@@ -46,8 +78,9 @@ class QmQueueWithDeprecations(QmQueueBase[JobApi]):
             user_ids=[user_id] if user_id else [],
             status=["In queue"],
         )
-        result = tuple(self._api.get_job_by_id(job.id) for job in new_jobs)
-        return result
+        # The query above already returned the jobs, so they are not looked up again one by one. Queued jobs are
+        # never simulations, so they are all regular jobs.
+        return tuple(self._api._get_job(job.id) for job in new_jobs)
 
     def add(
         self,
@@ -67,16 +100,7 @@ class QmQueueWithDeprecations(QmQueueBase[JobApi]):
             qm.queue.insert(program, position)  # adds at position
             ```
         """
-        warnings.warn(
-            deprecation_message(
-                method="queue.add",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, use qm.add_to_queue.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_ADD_DEPRECATION, DeprecationWarning, stacklevel=2)
         if compiler_options is None:
             compiler_options = CompilerOptionArguments()
 
@@ -94,16 +118,7 @@ class QmQueueWithDeprecations(QmQueueBase[JobApi]):
             program_id: A QUA program ID returned from the compile
                 function
         """
-        warnings.warn(
-            deprecation_message(
-                method="queue.add_compiled",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, use `qm.add_to_queue()`.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_ADD_COMPILED_DEPRECATION, DeprecationWarning, stacklevel=2)
         return self._api.add_to_queue(program_id)
 
     def remove_by_id(self, job_id: str) -> int:
@@ -120,16 +135,7 @@ class QmQueueWithDeprecations(QmQueueBase[JobApi]):
             qm.queue.remove_by_id(job_id)
             ```
         """
-        warnings.warn(
-            deprecation_message(
-                method="queue.remove_by_id",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, use qm.clear_queue(user_ids=[user_id]) or job.cancel().",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_REMOVE_BY_ID_DEPRECATION, DeprecationWarning, stacklevel=2)
         if job_id is None or job_id == "":
             raise ValueError("job_id can not be empty")
         return len(self._api.clear_queue([job_id]))
@@ -148,16 +154,7 @@ class QmQueueWithDeprecations(QmQueueBase[JobApi]):
             qm.queue.remove_by_id(job_id)
             ```
         """
-        warnings.warn(
-            deprecation_message(
-                method="queue.remove_by_user_id",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, use qm.clear_queue(user_ids=[user_id]) or job.cancel().",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_REMOVE_BY_USER_ID_DEPRECATION, DeprecationWarning, stacklevel=2)
         return len(self._api.clear_queue(user_ids=[user_id]))
 
     def clear(self) -> int:
@@ -166,14 +163,5 @@ class QmQueueWithDeprecations(QmQueueBase[JobApi]):
         Returns:
             The number of jobs removed
         """
-        warnings.warn(
-            deprecation_message(
-                method="queue.clear",
-                deprecated_in="1.2.0",
-                removed_in="2.0.0",
-                details="This method is going to be removed, use qm.clear_queue.",
-            ),
-            DeprecationWarning,
-            stacklevel=1,
-        )
+        warn_once(_CLEAR_DEPRECATION, DeprecationWarning, stacklevel=2)
         return len(self._api.clear_queue())
@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 from qm.jobs.qm_job import QmJob
 from qm.grpc.qm.pb import frontend_pb2
@@ -48,12 +49,16 @@ class QmPendingJob(QmBaseJob):
             The running ``QmJob``
         """
 
+        last_status: Optional[frontend_pb2.JobExecutionStatus] = None
+
         def on_iteration() -> bool:
+            nonlocal last_status
             status: frontend_pb2.JobExecutionStatus = self._job_manager.get_job_execution_status(
                 self._id, self._machine_id
             )
             value = which_one_of(status, "status")[1]
             if isinstance(value, (frontend_pb2.JobExecutionStatus.Running, frontend_pb2.JobExecutionStatus.Completed)):
+                last_status = status
                 return True
 
             if isinstance(value, (frontend_pb2.JobExecutionStatus.Pending, frontend_pb2.JobExecutionStatus.Loading)):
@@ -77,6 +82,7 @@ class QmPendingJob(QmBaseJob):
                 machine_id=self._machine_id,
                 frontend_api=self._frontend,
                 capabilities=self._capabilities,
+                initial_status=last_status,
             )
 
         return run_until_with_timeout(
@@ -1,15 +1,21 @@
-import warnings
+import functools
 from enum import Enum
 from typing import Tuple
 
 from qm.jobs.base_job import QmBaseJob
-from qm.utils import deprecation_message
-from qm.grpc.qm.pb import general_messages_pb2
+from qm.utils import warn_once, deprecation_message
 from qm.api.job_result_api import JobResultServiceApi
 from qm._report import ExecutionError, ExecutionReport
 
 from .._stream_results import StreamsManager
 
+_MANAGER_DEPRECATION = deprecation_message(
+    method="RunningQmJob.manager",
+    deprecated_in="1.1.0",
+    removed_in="1.2.0",
+    details="QMJob no longer has 'manager' property",
+)
+
 
 class AcquiringStatus(Enum):
     AcquireStopped = 0
@@ -23,16 +29,7 @@ class RunningQmJob(QmBaseJob):
         """
         The QM object where this job lives
         """
-        warnings.warn(
-            deprecation_message(
-                method="RunningQmJob.manager",
-                deprecated_in="1.1.0",
-                removed_in="1.2.0",
-                details="QMJob no longer has 'manager' property",
-            ),
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        warn_once(_MANAGER_DEPRECATION, DeprecationWarning, stacklevel=2)
         return None
 
     @property
@@ -42,9 +39,11 @@ class RunningQmJob(QmBaseJob):
         Returns:
             The handles that this job generated
         """
-        return StreamsManager(
-            JobResultServiceApi(self._frontend.connection_details, self._id), self._capabilities, wait_until_func=None
-        )
+        return StreamsManager(self._result_service, self._capabilities, wait_until_func=None)
+
+    @functools.cached_property
+    def _result_service(self) -> JobResultServiceApi:
+        return JobResultServiceApi(self._frontend.connection_details, self._id)
 
     def cancel(self) -> bool:
         """
@@ -97,10 +96,7 @@ class RunningQmJob(QmBaseJob):
         Returns:
             An object holding the errors that this job generated.
         """
-        errors = [
-            ExecutionError.create_from_grpc_message(item)
-            for item in JobResultServiceApi(self._frontend.connection_details, self.id).get_job_errors()
-        ]
+        errors = [ExecutionError.create_from_grpc_message(item) for item in self._result_service.get_job_errors()]
         return ExecutionReport(self._id, errors)
 
     def set_element_correction(
@@ -129,11 +125,7 @@ class RunningQmJob(QmBaseJob):
         Returns:
             The correction matrix, after rounding to the OPX resolution.
         """
-        correction_matrix = general_messages_pb2.Matrix(
-            v00=correction[0], v01=correction[1], v10=correction[2], v11=correction[3]
-        )
-
-        return self._job_manager.set_element_correction(self._id, element, correction_matrix)
+        return self._job_manager.set_element_correction(self._id, element, correction)
 
     def get_element_correction(self, element: str) -> Tuple[float, float, float, float]:
         """Gets the correction matrix for correcting gain and phase imbalances
@@ -79,8 +79,8 @@ class SimulatedJob(RunningQmJob):
 
         self._simulation_api = SimulationApi(self._frontend.connection_details)
 
-    def _initialize_from_job_status(self) -> None:
-        # Overriding this for simulated jobs to do nothing
+    def _initialize_from_job_status(self, status: Optional[frontend_pb2.JobExecutionStatus] = None) -> None:
+        # Overriding this for simulated jobs to do nothing, without fetching the status
         pass
 
     def get_simulated_waveform_report(self) -> Optional[WaveformReport]:
@@ -6,6 +6,8 @@ from qm.octave.octave_mixer_calibration import MixerCalibrationResults
 
 
 class AbstractLOCalibration(metaclass=ABCMeta):
+    __slots__ = ()
+
     @abstractmethod
     def get_i0(self) -> float:
         pass
@@ -16,6 +18,8 @@ class AbstractLOCalibration(metaclass=ABCMeta):
 
 
 class AbstractIFCalibration(metaclass=ABCMeta):
+    __slots__ = ()
+
     @abstractmethod
     def get_correction(self) -> Correction:
         pass
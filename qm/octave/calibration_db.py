@@ -1,12 +1,14 @@
 import time
 import logging
+import contextlib
 from pathlib import Path
-from dataclasses import asdict, dataclass
-from typing import Dict, Tuple, Union, Mapping, Optional, cast
+from dataclasses import dataclass
+from typing import Any, Dict, List, Type, Tuple, Union, Mapping, Iterator, Optional, cast
 
+from tinydb import TinyDB
 from tinydb.table import Document
-from tinydb import Query, TinyDB, where
-from tinydb.storages import JSONStorage
+from tinydb.middlewares import Middleware
+from tinydb.storages import Storage, JSONStorage
 
 from qm.octave.octave_mixer_calibration import MixerCalibrationResults
 from qm.octave.calibration_utils import Correction, convert_to_correction
@@ -15,13 +17,13 @@ from qm.octave.abstract_calibration_db import AbstractCalibrationDB, AbstractIFC
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class _Mode:
     octave_name: str
     octave_channel: int
 
 
-@dataclass
+@dataclass(slots=True)
 class _LOMode:
     mode_id: int
     lo_freq: Union[int, float]
@@ -29,14 +31,14 @@ class _LOMode:
     latest: int
 
 
-@dataclass
+@dataclass(slots=True)
 class _IFMode:
     lo_mode_id: int
     if_freq: float
     latest: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LOCalibrationDBSchema(AbstractLOCalibration):
     i0: float
     q0: float
@@ -52,8 +54,14 @@ class LOCalibrationDBSchema(AbstractLOCalibration):
     def get_q0(self) -> float:
         return self.q0
 
+    @classmethod
+    def _from_document(cls, doc: Mapping[str, Any]) -> "LOCalibrationDBSchema":
+        return cls(
+            doc["i0"], doc["q0"], doc["dc_gain"], doc["dc_phase"], doc["temperature"], doc["timestamp"], doc["method"]
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class IFCalibrationDBSchema(AbstractIFCalibration):
     gain: float
     phase: float
@@ -64,6 +72,77 @@ class IFCalibrationDBSchema(AbstractIFCalibration):
     def get_correction(self) -> Correction:
         return convert_to_correction(self.gain, self.phase)
 
+    @classmethod
+    def _from_document(cls, doc: Mapping[str, Any]) -> "IFCalibrationDBSchema":
+        return cls(doc["gain"], doc["phase"], doc["temperature"], doc["timestamp"], doc["method"])
+
+
+class _WriteThroughCachingMiddleware(Middleware):
+    """
+    Storage middleware that keeps the database in memory, so reads don't parse the file again.
+    Writes go straight to the file, unless they are deferred to write a batch of updates only once.
+    The modification time and size of the file are recorded on every read and write, so a change made by another
+    writer (e.g. another CalibrationDB of the same directory) can be detected with `is_stale`.
+    """
+
+    def __init__(self, storage_cls: Type[Storage], path: Path) -> None:
+        super().__init__(storage_cls)
+        self._path = path
+        self._loaded = False
+        self._deferring = 0
+        self._dirty = False
+        self._data: Optional[Dict[str, Dict[str, Any]]] = None
+        self._file_signature: Optional[Tuple[int, int]] = None
+
+    def _stat_file(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def is_stale(self) -> bool:
+        """
+        Whether the file was changed since it was last read or written through this middleware. A batch of deferred
+        writes owns the in-memory contents until it is written, so it is never reported as stale.
+        """
+        return self._loaded and not self._deferring and self._stat_file() != self._file_signature
+
+    def read(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        if not self._loaded:
+            self._data = self.storage.read()
+            self._loaded = True
+            self._file_signature = self._stat_file()
+        return self._data
+
+    def write(self, data: Dict[str, Dict[str, Any]]) -> None:
+        self._data = data
+        self._loaded = True
+        if self._deferring:
+            self._dirty = True
+        else:
+            self._write_through(data)
+
+    def _write_through(self, data: Dict[str, Dict[str, Any]]) -> None:
+        self.storage.write(data)
+        self._file_signature = self._stat_file()
+
+    def close(self) -> None:
+        # Pending writes of a batch that is still open when the DB is closed (e.g. on reset) are dropped
+        self._dirty = False
+        self.storage.close()
+
+    @contextlib.contextmanager
+    def deferred_writes(self) -> Iterator[None]:
+        self._deferring += 1
+        try:
+            yield
+        finally:
+            self._deferring -= 1
+            if not self._deferring and self._dirty:
+                self._dirty = False
+                self._write_through(cast(Dict[str, Dict[str, Any]], self._data))
+
 
 class _ModeNotFoundError(KeyError):
     def __init__(self, query: Tuple[Union[str, Union[int, float]], ...]):
@@ -80,78 +159,126 @@ class CalibrationDB(AbstractCalibrationDB):
 
     def __init__(self, path: Union[Path, str]) -> None:
         self._file_path: Path = Path(path) / "calibration_db.json"
-        self._db = TinyDB(self._file_path, indent=4, separators=(",", ": "), storage=JSONStorage)
+        self._storage = _WriteThroughCachingMiddleware(JSONStorage, self._file_path)
+        self._tinydb: Optional[TinyDB] = None
+        self._mode_idx: Dict[Tuple[str, int], int] = {}
+        self._lo_mode_idx: Dict[Tuple[int, Union[int, float], Optional[float]], int] = {}
+        self._lo_modes_by_freq: Dict[Tuple[int, Union[int, float]], List[int]] = {}
+        self._lo_mode_timestamp: Dict[int, float] = {}
+        self._lo_mode_latest: Dict[int, int] = {}
+        self._if_modes_by_lo_mode: Dict[int, Dict[float, int]] = {}
+        self._if_mode_latest: Dict[int, int] = {}
 
     def __del__(self) -> None:
-        self._db.close()
+        if self._tinydb is not None:
+            self._tinydb.close()
 
-    def reset(self) -> None:
-        self._db.close()
-
-        self._file_path.unlink()
-        self._db = TinyDB(self._file_path, indent=4, separators=(",", ": "), storage=JSONStorage)
+    def _ensure_open(self) -> TinyDB:
+        """
+        The database file is opened (and indexed) on first use, so an unused calibration DB costs nothing.
+        It is opened again when another writer changed it since it was last read, so that neither the cached contents
+        nor the indexes are stale, and the updates of this instance don't overwrite the other's.
+        Must be called before reading the indexes.
+        """
+        if self._tinydb is not None and self._storage.is_stale():
+            self._tinydb.close()
+            self._tinydb = None
+            self._storage = _WriteThroughCachingMiddleware(JSONStorage, self._file_path)
+        if self._tinydb is None:
+            self._tinydb = TinyDB(self._file_path, indent=4, separators=(",", ": "), storage=self._storage)
+            self._build_indexes(self._tinydb)
+        return self._tinydb
 
-    def _query_mode(self, octave_channel: Tuple[str, int]) -> Optional[Document]:
-        return cast(
-            Optional[Document],
-            self._db.table("modes").get(
-                (Query().octave_name == octave_channel[0]) & (Query().octave_channel == octave_channel[1])
-            ),
-        )
+    def reset(self) -> None:
+        if self._tinydb is not None:
+            self._tinydb.close()
+            self._tinydb = None
 
-    def _get_timestamp(self, doc: Document) -> float:
-        a = cast(Document, self._db.table("lo_cal").get(doc_id=doc["latest"]))
-        return cast(float, a["timestamp"])
+        self._file_path.unlink(missing_ok=True)
+        self._storage = _WriteThroughCachingMiddleware(JSONStorage, self._file_path)
 
-    def _query_lo_mode(self, mode_id: int, lo_freq: Union[int, float], gain: Optional[float]) -> Optional[Document]:
+    def _build_indexes(self, db: TinyDB) -> None:
+        """
+        Index the doc ids of the mode tables by their lookup keys, so queries don't scan the tables.
+        The mode keys never change after insertion, and their "latest" field is mirrored here on every update.
+        """
+        self._mode_idx.clear()
+        self._lo_mode_idx.clear()
+        self._lo_modes_by_freq.clear()
+        self._lo_mode_timestamp.clear()
+        self._lo_mode_latest.clear()
+        self._if_modes_by_lo_mode.clear()
+        self._if_mode_latest.clear()
+        for doc in db.table("modes").all():
+            self._mode_idx.setdefault((doc["octave_name"], doc["octave_channel"]), doc.doc_id)
+        lo_cal_timestamps = {doc.doc_id: doc["timestamp"] for doc in db.table("lo_cal").all()}
+        for doc in db.table("lo_modes").all():
+            self._index_lo_mode(doc.doc_id, doc["mode_id"], doc["lo_freq"], doc["gain"])
+            self._lo_mode_latest[doc.doc_id] = doc["latest"]
+            if doc["latest"] in lo_cal_timestamps:
+                self._lo_mode_timestamp[doc.doc_id] = lo_cal_timestamps[doc["latest"]]
+        for doc in db.table("if_modes").all():
+            self._if_modes_by_lo_mode.setdefault(doc["lo_mode_id"], {}).setdefault(doc["if_freq"], doc.doc_id)
+            self._if_mode_latest[doc.doc_id] = doc["latest"]
+
+    def _index_lo_mode(self, doc_id: int, mode_id: int, lo_freq: Union[int, float], gain: Optional[float]) -> None:
+        self._lo_mode_idx.setdefault((mode_id, lo_freq, gain), doc_id)
+        self._lo_modes_by_freq.setdefault((mode_id, lo_freq), []).append(doc_id)
+
+    def _find_lo_mode_id(self, mode_id: int, lo_freq: Union[int, float], gain: Optional[float]) -> Optional[int]:
+        self._ensure_open()
         if gain is not None:
-            return cast(
-                Optional[Document],
-                self._db.table("lo_modes").get(
-                    (Query().mode_id == mode_id) & (Query().lo_freq == lo_freq) & (Query().gain == gain)
-                ),
-            )
-
-        lo_modes = self._db.table("lo_modes").search((Query().mode_id == mode_id) & (Query().lo_freq == lo_freq))
-        if not lo_modes:
-            return None
+            return self._lo_mode_idx.get((mode_id, lo_freq, gain))
 
-        return max(lo_modes, key=self._get_timestamp)
+        doc_ids = self._lo_modes_by_freq.get((mode_id, lo_freq))
+        if not doc_ids:
+            return None
 
-    def _query_if_mode(self, lo_mode_id: int, if_freq: float) -> Optional[Document]:
-        return cast(
-            Optional[Document],
-            self._db.table("if_modes").get((Query().lo_mode_id == lo_mode_id) & (Query().if_freq == if_freq)),
-        )
+        # Without a gain, take the LO mode (of any gain) that was calibrated last
+        return max(doc_ids, key=lambda doc_id: self._lo_mode_timestamp.get(doc_id, 0.0))
 
     def _mode_id(self, octave_channel: Tuple[str, int], create: bool = False) -> int:
-        query_result = self._query_mode(octave_channel)
-        if query_result is None:
+        db = self._ensure_open()
+        doc_id = self._mode_idx.get(octave_channel)
+        if doc_id is None:
             if create:
-                return self._db.table("modes").insert(asdict(_Mode(*octave_channel)))
+                doc_id = db.table("modes").insert(
+                    {"octave_name": octave_channel[0], "octave_channel": octave_channel[1]}
+                )
+                self._mode_idx[octave_channel] = doc_id
+                return doc_id
             raise _ModeNotFoundError(octave_channel)
         else:
-            return query_result.doc_id
+            return doc_id
 
     def _lo_mode_id(self, mode_id: int, lo_freq: Union[int, float], gain: Optional[float], create: bool = False) -> int:
-        query_result = self._query_lo_mode(mode_id, lo_freq, gain)
-        if query_result is None:
+        doc_id = self._find_lo_mode_id(mode_id, lo_freq, gain)
+        if doc_id is None:
             if create:
-                return self._db.table("lo_modes").insert(asdict(_LOMode(mode_id, lo_freq, gain, 0)))
+                doc_id = (
+                    self._ensure_open()
+                    .table("lo_modes")
+                    .insert({"mode_id": mode_id, "lo_freq": lo_freq, "gain": gain, "latest": 0})
+                )
+                self._index_lo_mode(doc_id, mode_id, lo_freq, gain)
+                return doc_id
             else:
                 raise _ModeNotFoundError((mode_id, lo_freq))
         else:
-            return query_result.doc_id
+            return doc_id
 
     def _if_mode_id(self, lo_mode_id: int, if_freq: float, create: bool = False) -> int:
-        query_result = self._query_if_mode(lo_mode_id, if_freq)
-        if query_result is None:
+        db = self._ensure_open()
+        doc_id = self._if_modes_by_lo_mode.get(lo_mode_id, {}).get(if_freq)
+        if doc_id is None:
             if create:
-                return self._db.table("if_modes").insert(asdict(_IFMode(lo_mode_id, if_freq, 0)))
+                doc_id = db.table("if_modes").insert({"lo_mode_id": lo_mode_id, "if_freq": if_freq, "latest": 0})
+                self._if_modes_by_lo_mode.setdefault(lo_mode_id, {})[if_freq] = doc_id
+                return doc_id
             else:
                 raise _ModeNotFoundError((lo_mode_id, if_freq))
         else:
-            return query_result.doc_id
+            return doc_id
 
     def _update_lo_calibration(
         self,
@@ -171,11 +298,22 @@ class CalibrationDB(AbstractCalibrationDB):
 
         timestamp = time.time()
 
-        lo_cal_id = self._db.table("lo_cal").insert(
-            asdict(LOCalibrationDBSchema(i0, q0, dc_gain, dc_phase, temperature, timestamp, method))
+        db = self._ensure_open()
+        lo_cal_id = db.table("lo_cal").insert(
+            {
+                "i0": i0,
+                "q0": q0,
+                "dc_gain": dc_gain,
+                "dc_phase": dc_phase,
+                "temperature": temperature,
+                "timestamp": timestamp,
+                "method": method,
+            }
         )
 
-        self._db.table("lo_modes").update(asdict(_LOMode(mode_id, lo_freq, gain, lo_cal_id)), doc_ids=[lo_mode_id])
+        db.table("lo_modes").update({"latest": lo_cal_id}, doc_ids=[lo_mode_id])
+        self._lo_mode_latest[lo_mode_id] = lo_cal_id
+        self._lo_mode_timestamp[lo_mode_id] = timestamp
 
     def _update_if_calibration(
         self,
@@ -194,11 +332,13 @@ class CalibrationDB(AbstractCalibrationDB):
         if_mode_id = self._if_mode_id(lo_mode_id, if_freq, create=True)
 
         timestamp = time.time()
-        if_cal_id = self._db.table("if_cal").insert(
-            asdict(IFCalibrationDBSchema(gain, phase, temperature, timestamp, method))
+        db = self._ensure_open()
+        if_cal_id = db.table("if_cal").insert(
+            {"gain": gain, "phase": phase, "temperature": temperature, "timestamp": timestamp, "method": method}
         )
 
-        self._db.table("if_modes").update(asdict(_IFMode(lo_mode_id, if_freq, if_cal_id)), doc_ids=[if_mode_id])
+        db.table("if_modes").update({"latest": if_cal_id}, doc_ids=[if_mode_id])
+        self._if_mode_latest[if_mode_id] = if_cal_id
 
     def get_lo_cal(
         self, octave_channel: Tuple[str, int], lo_freq: Union[int, float], gain: Optional[float]
@@ -216,19 +356,17 @@ class CalibrationDB(AbstractCalibrationDB):
         """
         try:
             mode_id = self._mode_id(octave_channel)
+            lo_mode_id = self._lo_mode_id(mode_id, lo_freq, gain)
         except _ModeNotFoundError:
             return None
-        lo_mode = self._query_lo_mode(mode_id, lo_freq, gain)
-        if lo_mode is None or lo_mode["latest"] == 0:
+        latest = self._lo_mode_latest.get(lo_mode_id, 0)
+        if latest == 0:
             return None
 
-        lo_cal = cast(Optional[Document], self._db.table("lo_cal").get(doc_id=lo_mode["latest"]))
+        lo_cal = cast(Optional[Document], self._ensure_open().table("lo_cal").get(doc_id=latest))
         if lo_cal is None:
             return None
-        lo_cal.pop("lo_mode_id", None)
-        lo_cal_obj = LOCalibrationDBSchema(**lo_cal)
-
-        return lo_cal_obj
+        return LOCalibrationDBSchema._from_document(lo_cal)
 
     def get_if_cal(
         self,
@@ -252,21 +390,17 @@ class CalibrationDB(AbstractCalibrationDB):
         try:
             mode_id = self._mode_id(octave_channel, create=False)
             lo_mode_id = self._lo_mode_id(mode_id, lo_freq, gain, create=False)
-            if_mode = self._query_if_mode(lo_mode_id, if_freq)
+            if_mode_id = self._if_mode_id(lo_mode_id, if_freq, create=False)
         except _ModeNotFoundError:
             return None
-
-        if if_mode is None or if_mode["latest"] == 0:
+        latest = self._if_mode_latest.get(if_mode_id, 0)
+        if latest == 0:
             return None
 
-        if_cal = self._db.table("if_cal").get(doc_id=if_mode["latest"])
+        if_cal = cast(Optional[Document], self._ensure_open().table("if_cal").get(doc_id=latest))
         if if_cal is None:
             return None
-        assert isinstance(if_cal, dict)
-        if_cal.pop("if_mode_id", None)
-        if_cal_obj = IFCalibrationDBSchema(**if_cal)
-
-        return if_cal_obj
+        return IFCalibrationDBSchema._from_document(if_cal)
 
     def get_all_if_cal_for_lo(
         self, octave_channel: Tuple[str, int], lo_freq: Union[int, float], gain: Optional[float]
@@ -288,21 +422,33 @@ class CalibrationDB(AbstractCalibrationDB):
         except _ModeNotFoundError:
             return {}
 
-        if_modes = self._db.table("if_modes").search(where("lo_mode_id") == lo_mode_id)
-
-        if if_modes is None:
+        if_cal_table = self._ensure_open().table("if_cal")
+        if_modes = self._if_modes_by_lo_mode.get(lo_mode_id)
+        if not if_modes:
             return {}
 
         if_dict: Dict[Union[int, float], IFCalibrationDBSchema] = {}
-        for if_mode in if_modes:
-            if_freq = if_mode["if_freq"]
-            if_cal = self.get_if_cal(octave_channel, lo_freq, gain, if_freq)
-
-            if if_cal:
-                if_dict[if_freq] = if_cal
+        for if_freq, if_mode_id in if_modes.items():
+            latest = self._if_mode_latest.get(if_mode_id, 0)
+            if latest == 0:
+                continue
+            if_cal = cast(Optional[Document], if_cal_table.get(doc_id=latest))
+            if if_cal is None:
+                continue
+            if_dict[if_freq] = IFCalibrationDBSchema._from_document(if_cal)
 
         return if_dict
 
+    @contextlib.contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Write the calibration results updated within the context to the file only once, when the context exits.
+        Useful when calling `update_calibration_result` many times, e.g. when calibrating several elements.
+        """
+        self._ensure_open()
+        with self._storage.deferred_writes():
+            yield
+
     def update_calibration_result(
         self, result: MixerCalibrationResults, octave_channel: Tuple[str, int], method: str = ""
     ) -> None:
@@ -314,29 +460,30 @@ class CalibrationDB(AbstractCalibrationDB):
             octave_channel: The octave channel to update the database with.
             method: Deprecated.
         """
-
-        for (lo_freq, output_gain), lo_cal in result.items():
-            self._update_lo_calibration(
-                octave_channel,
-                lo_freq,
-                output_gain,
-                lo_cal.i0,
-                lo_cal.q0,
-                lo_cal.dc_gain,
-                lo_cal.dc_phase,
-                lo_cal.temperature,
-                method,
-            )
-
-            for if_freq, if_cal in lo_cal.image.items():
-                fine_cal = if_cal.fine
-                self._update_if_calibration(
+        self._ensure_open()
+        with self._storage.deferred_writes():
+            for (lo_freq, output_gain), lo_cal in result.items():
+                self._update_lo_calibration(
                     octave_channel,
                     lo_freq,
                     output_gain,
-                    if_freq,
-                    fine_cal.gain,
-                    fine_cal.phase,
+                    lo_cal.i0,
+                    lo_cal.q0,
+                    lo_cal.dc_gain,
+                    lo_cal.dc_phase,
                     lo_cal.temperature,
                     method,
                 )
+
+                for if_freq, if_cal in lo_cal.image.items():
+                    fine_cal = if_cal.fine
+                    self._update_if_calibration(
+                        octave_channel,
+                        lo_freq,
+                        output_gain,
+                        if_freq,
+                        fine_cal.gain,
+                        fine_cal.phase,
+                        lo_cal.temperature,
+                        method,
+                    )
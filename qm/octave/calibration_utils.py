@@ -1,7 +1,5 @@
 from typing import Tuple
 
-import numpy as np
-
 Correction = Tuple[float, float, float, float]
 
 
@@ -9,14 +7,11 @@ def convert_to_correction(gain: float, phase: float) -> Correction:
     """
     Convert gain and phase to a correction matrix.
     """
-    s = phase
-    c = np.polyval([-3.125, 1.5, 1], s**2)
-    g_plus = np.polyval([0.5, 1, 1], gain)
-    g_minus = np.polyval([0.5, -1, 1], gain)
-
-    c00 = float(g_plus * c)
-    c01 = float(g_plus * s)
-    c10 = float(g_minus * s)
-    c11 = float(g_minus * c)
+    s = float(phase)
+    gain = float(gain)
+    s2 = s * s
+    c = 1.0 + s2 * (1.5 - 3.125 * s2)
+    g_plus = 1.0 + gain * (1.0 + 0.5 * gain)
+    g_minus = 1.0 - gain * (1.0 - 0.5 * gain)
 
-    return c00, c01, c10, c11
+    return g_plus * c, g_plus * s, g_minus * s, g_minus * c
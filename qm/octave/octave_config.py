@@ -62,6 +62,8 @@ class QmOctaveConfig:
     def __init__(self, fan: Any = None):
         self._devices: Dict[str, ConnectionDetails] = {}
         self._loopbacks: Optional[Dict[LoopbackInfo[OctaveLOSource], LoopbackInfo[OctaveOutput]]] = None
+        # Incremented whenever a loopback is added, so that data derived from the loopbacks can be invalidated
+        self._loopbacks_version = 0
         self._opx_octave_port_mapping: Optional[ConnectionMapping] = None
         self._octave_to_opx_port_mapping: Optional[Dict[Tuple[str, str], StandardPort]] = None
         self._calibration_db: Optional[AbstractCalibrationDB] = None
@@ -333,6 +335,7 @@ class QmOctaveConfig:
         loop_back_source = LoopbackInfo(octave_output_name, octave_output_port)
         loop_back_destination = LoopbackInfo(octave_input_name, octave_input_port)
         self._loopbacks[loop_back_destination] = loop_back_source
+        self._loopbacks_version += 1
 
     def get_lo_loopbacks_by_octave(self, octave_name: str) -> Dict[OctaveLOSource, OctaveOutput]:
         """
@@ -16,6 +16,7 @@ from typing import (
     Tuple,
     Union,
     Generic,
+    Mapping,
     TypeVar,
     Iterator,
     Optional,
@@ -23,12 +24,12 @@ from typing import (
     MutableSequence,
 )
 
-from google.protobuf.wrappers_pb2 import BoolValue, StringValue, UInt32Value, UInt64Value
+from google.protobuf.wrappers_pb2 import StringValue, UInt32Value, UInt64Value
 
 from qm.type_hinting import Number
-from qm.grpc.octave.v1 import api_pb2
 from qm.octave_sdk.octave import ClockInfo
 from qm.grpc.qm.pb import inc_qua_config_pb2
+from qm.octave_sdk.batch import BatchSingleton
 from qm.octave.octave_config import QmOctaveConfig
 from qm.type_hinting.config_types import StandardPort
 from qm.octave._calibration_config import _prep_config
@@ -164,6 +165,8 @@ class OctaveManager:
         self._capabilities = capabilities
         self._octave_config = config or QmOctaveConfig()
         self._upconverted_states: Dict[Tuple[str, int], _UpconvertedState] = {}
+        self._clients: Dict[str, Tuple[ConnectionDetails, int, Octave]] = {}
+        self._lo_loopbacks: Dict[str, Tuple[int, Dict[OctaveLOSource, OctaveOutput]]] = {}
         self._perform_healthcheck_at_init()
 
     def _perform_healthcheck_at_init(self) -> None:
@@ -171,12 +174,35 @@ class OctaveManager:
             self.get_client(octave_name)
 
     def get_client(self, name: str) -> Octave:
-        return get_device(
-            connection_info=self._octave_config._devices[name],
-            loop_backs=self._octave_config.get_lo_loopbacks_by_octave(name),
+        # Each client is created (and its fan is set) only once, and again only if its device info or the loopbacks
+        # were changed in the octave config since
+        connection_info = self._octave_config._devices[name]
+        loopbacks_version = self._octave_config._loopbacks_version
+        cached = self._clients.get(name)
+        if cached is not None and cached[0] is connection_info and cached[1] == loopbacks_version:
+            return cached[2]
+
+        client = get_device(
+            connection_info=connection_info,
+            loop_backs=self._get_lo_loopbacks(name),
             octave_name=name,
             fan=self._octave_config.fan,
         )
+        self._clients[name] = (connection_info, loopbacks_version, client)
+        return client
+
+    def _invalidate_client(self, name: str) -> None:
+        self._clients.pop(name, None)
+
+    def _get_lo_loopbacks(self, octave_name: str) -> Dict[OctaveLOSource, OctaveOutput]:
+        loopbacks_version = self._octave_config._loopbacks_version
+        cached = self._lo_loopbacks.get(octave_name)
+        if cached is not None and cached[0] == loopbacks_version:
+            return cached[1]
+
+        loopbacks = self._octave_config.get_lo_loopbacks_by_octave(octave_name)
+        self._lo_loopbacks[octave_name] = (loopbacks_version, loopbacks)
+        return loopbacks
 
     def get_output_port(
         self,
@@ -283,7 +309,7 @@ class OctaveManager:
         octave = self._get_client_from_port(octave_output_port)
         octave_name, port_index = octave_output_port
 
-        loop_backs = self._octave_config.get_lo_loopbacks_by_octave(octave_name)
+        loop_backs = self._get_lo_loopbacks(octave_name)
 
         if lo_source != OctaveLOSource.Internal and lo_source not in loop_backs:
             raise SetFrequencyException(f"Cannot set frequency to an external lo source" f" {lo_source.name}")
@@ -317,19 +343,27 @@ class OctaveManager:
             octave_output_port
             switch_mode
         """
-        octave = self._get_client_from_port(octave_output_port)
-        index = octave_output_port[1]
-        octave.rf_outputs[octave_output_port[1]].set_output(switch_mode)
-
-        # Shuts down the second stage amplifier if the switch is off
-        power_amp_enabled = switch_mode != RFOutputMode.off
-        octave._client.update(
-            updates=[
-                api_pb2.SingleUpdate(
-                    rf_up_conv=api_pb2.RFUpConvUpdate(index=index, power_amp_enabled=BoolValue(value=power_amp_enabled))
+        self.set_rf_output_modes({octave_output_port: switch_mode})
+
+    def set_rf_output_modes(self, port_modes: Mapping[Tuple[str, int], RFOutputMode]) -> None:
+        """Configures the output switches of several upconverters, see `set_rf_output_mode`.
+        When more than one port is given, the updates are sent in batch mode, so each octave gets a single update.
+
+        Args:
+            port_modes: The switch mode of each octave output port
+        """
+        batch = len(port_modes) > 1 and not BatchSingleton().is_batch_mode
+        if batch:
+            self.start_batch_mode()
+        try:
+            for (octave_name, index), switch_mode in port_modes.items():
+                # Shuts down the second stage amplifier if the switch is off
+                self.get_client(octave_name).rf_outputs[index].set_output(
+                    switch_mode, power_amp_enabled=switch_mode != RFOutputMode.off
                 )
-            ]
-        )
+        finally:
+            if batch:
+                self.end_batch_mode()
 
     def set_rf_output_gain(
         self,
@@ -411,7 +445,10 @@ class OctaveManager:
             True on success, False otherwise
         """
         if self._capabilities.supports(QopCaps.octave_reset):
-            return self.get_client(octave_name).reset()
+            result = self.get_client(octave_name).reset()
+            # The reset returns the hardware to its defaults, so the fan has to be set again on the next use
+            self._invalidate_client(octave_name)
+            return result
         else:
             logger.error("QOP version do not support Octave reset function")
             return False
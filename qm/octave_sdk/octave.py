@@ -919,10 +919,11 @@ class RFOutput:
             # define default -20 dB on 8Ghz
             self._set_gain(crb, -20, 8e9, True)
 
-    def set_output(self, mode: RFOutputMode) -> None:
+    def set_output(self, mode: RFOutputMode, power_amp_enabled: Optional[bool] = None) -> None:
         """
 
         :param mode:
+        :param power_amp_enabled: If given, also enables/disables the second stage amplifier in the same update
         """
         crb = ClientRequestBuilder()
 
@@ -950,6 +951,9 @@ class RFOutput:
                 f"RF Output Mode {mode} is not supported. only `RFOutputMode` enum" f" values are supported"
             )
 
+        if power_amp_enabled is not None:
+            crb.up[self._index].power_amp_enabled.value = power_amp_enabled
+
         self._context.client.update(crb.get_updates())
 
     def set_lo_source(self, source_name: OctaveLOSource, ignore_shared_errors: bool = False) -> None:
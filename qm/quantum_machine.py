@@ -853,6 +853,7 @@ class QuantumMachine:
                 machine_id=self._id,
                 frontend_api=self._frontend,
                 capabilities=self._capabilities,
+                initial_status=status,
             )
         if isinstance(status_inst, (frontend_pb2.JobExecutionStatus.Pending, frontend_pb2.JobExecutionStatus.Loading)):
             return QmPendingJob(
@@ -860,6 +861,7 @@ class QuantumMachine:
                 machine_id=self._id,
                 frontend_api=self._frontend,
                 capabilities=self._capabilities,
+                initial_status=status,
             )
 
         raise ErrorJobStateError(
@@ -1,6 +1,6 @@
-from qm.utils.deprecation_utils import deprecation_message
-from qm.utils.protobuf_utils import LOG_LEVEL_MAP, list_fields
 from qm.utils.general_utils import SERVICE_HEADER_NAME, run_until_with_timeout
+from qm.utils.protobuf_utils import LOG_LEVEL_MAP, LOG_LEVEL_TABLE, list_fields
+from qm.utils.deprecation_utils import warn_once, reset_warn_once, deprecated_method, deprecation_message
 from qm.utils.types_utils import (
     collection_has_type,
     collection_has_type_int,
@@ -12,6 +12,7 @@ from qm.utils.types_utils import (
 
 __all__ = [
     "LOG_LEVEL_MAP",
+    "LOG_LEVEL_TABLE",
     "get_all_iterable_data_types",
     "collection_has_type",
     "collection_has_type_bool",
@@ -19,6 +20,9 @@ __all__ = [
     "collection_has_type_float",
     "get_iterable_elements_datatype",
     "deprecation_message",
+    "warn_once",
+    "reset_warn_once",
+    "deprecated_method",
     "list_fields",
     "run_until_with_timeout",
     "SERVICE_HEADER_NAME",
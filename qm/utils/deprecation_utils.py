@@ -1,5 +1,6 @@
 import warnings
-from typing import Any, TypeVar, Optional
+import functools
+from typing import Any, Set, TypeVar, Callable, Optional, ParamSpec
 
 
 def throw_warning(message: str, category: Optional[type] = None, stacklevel: int = 1, source: Any = None) -> None:
@@ -9,6 +10,32 @@ def throw_warning(message: str, category: Optional[type] = None, stacklevel: int
     warnings.warn(message, category=category, stacklevel=stacklevel + 1, source=source)
 
 
+_emitted_warnings: Set[str] = set()
+
+
+def warn_once(message: str, category: Optional[type] = None, stacklevel: int = 1) -> None:
+    """
+    This function wraps `warnings.warn`, but emits each message at most once per process. It is meant for warnings
+    raised from methods that may be called in tight loops, where going through the warnings machinery on every call is
+    expensive.
+    A message counts as emitted even when the warnings filters suppressed it, e.g. inside `warnings.catch_warnings()`,
+    so use `reset_warn_once` to have the messages emitted again.
+    """
+    # The message itself is the key: the messages are module-level constants whose hash is computed once, so repeated
+    # calls cost a single set lookup
+    if message in _emitted_warnings:
+        return
+    _emitted_warnings.add(message)
+    warnings.warn(message, category=category, stacklevel=stacklevel + 1)
+
+
+def reset_warn_once() -> None:
+    """
+    Forgets the messages emitted by `warn_once`, so that each of them is emitted again on its next call.
+    """
+    _emitted_warnings.clear()
+
+
 def deprecation_message(method: str, deprecated_in: str, removed_in: str, details: str = "") -> str:
     """
     Generates a deprecation message for deprecation a function.
@@ -37,3 +64,21 @@ def deprecation_message(method: str, deprecated_in: str, removed_in: str, detail
 
 
 T = TypeVar("T")
+P = ParamSpec("P")
+
+
+def deprecated_method(message: str) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """
+    Decorates a method so that calling it emits `message` as a `DeprecationWarning` (once per process, see `warn_once`),
+    pointing at the caller of the method.
+    """
+
+    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            warn_once(message, DeprecationWarning, stacklevel=2)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -14,6 +14,8 @@ LOG_LEVEL_MAP = {
     general_messages_pb2.MessageLevel.Message_LEVEL_WARNING: logging.WARN,
     general_messages_pb2.MessageLevel.Message_LEVEL_INFO: logging.INFO,
 }
+# The message levels are the enum values 0..N-1, so they can index a tuple directly instead of being hashed.
+LOG_LEVEL_TABLE = tuple(LOG_LEVEL_MAP[level] for level in sorted(general_messages_pb2.MessageLevel.values()))
 
 
 Node = Union[Message, Iterable["Node"]]
@@ -0,0 +1,60 @@
+from unittest.mock import patch
+from types import SimpleNamespace
+
+import pytest
+from tinydb.storages import JSONStorage
+
+from qm.octave.calibration_db import CalibrationDB
+
+CHANNEL = ("octave1", 1)
+
+
+def _result(lo_freq, i0, if_freqs, gain=None):
+    image = {if_freq: SimpleNamespace(fine=SimpleNamespace(gain=0.01, phase=0.02)) for if_freq in if_freqs}
+    lo_cal = SimpleNamespace(i0=i0, q0=0.2, dc_gain=0.1, dc_phase=0.0, temperature=30.0, image=image)
+    return {(lo_freq, gain): lo_cal}
+
+
+@pytest.fixture
+def count_writes():
+    with patch.object(JSONStorage, "write", autospec=True, side_effect=JSONStorage.write) as write:
+        yield write
+
+
+def test_batch_updates_write_the_file_once(tmp_path, count_writes):
+    db = CalibrationDB(tmp_path)
+    with db.batch_updates():
+        db.update_calibration_result(_result(6e9, 0.1, [50e6, 60e6]), CHANNEL)
+        db.update_calibration_result(_result(7e9, 0.2, [50e6]), CHANNEL)
+        assert count_writes.call_count == 0
+        assert db.get_lo_cal(CHANNEL, 7e9, None).get_i0() == 0.2
+    assert count_writes.call_count == 1
+    assert CalibrationDB(tmp_path).get_lo_cal(CHANNEL, 7e9, None).get_i0() == 0.2
+
+
+def test_nested_batch_updates_write_on_the_outer_exit(tmp_path, count_writes):
+    db = CalibrationDB(tmp_path)
+    with db.batch_updates():
+        with db.batch_updates():
+            db.update_calibration_result(_result(6e9, 0.1, [50e6]), CHANNEL)
+        assert count_writes.call_count == 0
+        db.update_calibration_result(_result(7e9, 0.2, [50e6]), CHANNEL)
+    assert count_writes.call_count == 1
+    reopened = CalibrationDB(tmp_path)
+    assert reopened.get_lo_cal(CHANNEL, 6e9, None).get_i0() == 0.1
+    assert reopened.get_lo_cal(CHANNEL, 7e9, None).get_i0() == 0.2
+
+
+def test_instances_of_the_same_directory_see_each_others_updates(tmp_path):
+    first = CalibrationDB(tmp_path)
+    second = CalibrationDB(tmp_path)
+    first.update_calibration_result(_result(6e9, 0.1, [50e6]), CHANNEL)
+    assert second.get_lo_cal(CHANNEL, 6e9, None).get_i0() == 0.1
+
+    second.update_calibration_result(_result(6e9, 0.2, [60e6]), CHANNEL)
+    first.update_calibration_result(_result(7e9, 0.3, [50e6]), CHANNEL)
+
+    reopened = CalibrationDB(tmp_path)
+    assert reopened.get_lo_cal(CHANNEL, 6e9, None).get_i0() == 0.2
+    assert reopened.get_lo_cal(CHANNEL, 7e9, None).get_i0() == 0.3
+    assert set(reopened.get_all_if_cal_for_lo(CHANNEL, 6e9, None)) == {50e6, 60e6}
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from qm.octave_sdk.batch import BatchSingleton
+from qm.octave import RFOutputMode, QmOctaveConfig
+from qm.octave.octave_manager import OctaveManager
+from qm.api.models.capabilities import ServerCapabilities
+
+OCTAVE_NAMES = ("octave1", "octave2")
+
+
+@pytest.fixture
+def octaves():
+    # A single parent mock, whose attributes stand in for the Octave clients
+    octaves = MagicMock()
+    for name in OCTAVE_NAMES:
+        octave = getattr(octaves, name)
+        octave.start_batch_mode.side_effect = BatchSingleton().start_batch_mode
+        octave.end_batch_mode.side_effect = BatchSingleton().end_batch_mode
+    yield octaves
+    BatchSingleton().end_batch_mode()
+
+
+@pytest.fixture
+def octave_manager(octaves):
+    config = QmOctaveConfig()
+    for port, name in enumerate(OCTAVE_NAMES, start=50):
+        config.add_device_info(name, "127.0.0.1", port)
+    with patch.object(OctaveManager, "get_client", side_effect=lambda name: getattr(octaves, name)):
+        yield OctaveManager(config, MagicMock(), ServerCapabilities([]))
+
+
+def _record_batch_mode(octaves):
+    in_batch_mode = []
+    for name in OCTAVE_NAMES:
+        set_output = getattr(octaves, name).rf_outputs.__getitem__.return_value.set_output
+        set_output.side_effect = lambda *args, **kwargs: in_batch_mode.append(BatchSingleton().is_batch_mode)
+    return in_batch_mode
+
+
+def test_set_rf_output_modes_sends_the_updates_in_one_batch(octave_manager, octaves):
+    in_batch_mode = _record_batch_mode(octaves)
+    octave_manager.set_rf_output_modes(
+        {
+            ("octave1", 1): RFOutputMode.on,
+            ("octave1", 2): RFOutputMode.off,
+            ("octave2", 1): RFOutputMode.trig_normal,
+        }
+    )
+
+    assert in_batch_mode == [True, True, True]
+    assert not BatchSingleton().is_batch_mode
+    for name in OCTAVE_NAMES:
+        getattr(octaves, name).end_batch_mode.assert_called_once_with()
+    octaves.octave1.rf_outputs.__getitem__.return_value.set_output.assert_any_call(
+        RFOutputMode.off, power_amp_enabled=False
+    )
+
+
+def test_set_rf_output_mode_of_a_single_port_is_sent_directly(octave_manager, octaves):
+    in_batch_mode = _record_batch_mode(octaves)
+    octave_manager.set_rf_output_mode(("octave2", 1), RFOutputMode.on)
+
+    assert in_batch_mode == [False]
+    octaves.octave2.start_batch_mode.assert_not_called()
+
+
+def test_set_rf_output_modes_leaves_batch_mode_on_error(octave_manager, octaves):
+    octaves.octave2.rf_outputs.__getitem__.return_value.set_output.side_effect = ValueError("Octave update failed")
+    with pytest.raises(ValueError):
+        octave_manager.set_rf_output_modes({("octave1", 1): RFOutputMode.on, ("octave2", 1): RFOutputMode.on})
+
+    assert not BatchSingleton().is_batch_mode
+    for name in OCTAVE_NAMES:
+        getattr(octaves, name).end_batch_mode.assert_called_once_with()
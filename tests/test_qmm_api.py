@@ -0,0 +1,35 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from qm.api.v2.qmm_api import QmmApi
+from qm.grpc.qm.grpc.v2 import qmm_api_pb2
+from qm.api.models.capabilities import ServerCapabilities
+from qm.api.models.server_details import ConnectionDetails
+
+
+def _jobs_response(*job_ids):
+    return qmm_api_pb2.GetJobsSuccess(jobs=[qmm_api_pb2.JobResponseData(job_id=job_id) for job_id in job_ids])
+
+
+@pytest.fixture
+def qmm_api():
+    return QmmApi(ConnectionDetails("127.0.0.1", 80), ServerCapabilities([]), None, MagicMock())
+
+
+def test_get_jobs_by_ids_leaves_out_missing_ids(qmm_api):
+    with patch.object(QmmApi, "_run", return_value=_jobs_response("job-1", "job-3")) as run:
+        jobs = qmm_api.get_jobs_by_ids(["job-1", "job-2", "job-3"])
+
+    assert set(jobs) == {"job-1", "job-3"}
+    assert jobs["job-3"].id == "job-3"
+    run.assert_called_once()
+    assert list(run.call_args.args[1].query.job_ids) == ["job-1", "job-2", "job-3"]
+
+
+def test_get_job_returns_the_same_instance_for_the_same_id(qmm_api):
+    with patch.object(QmmApi, "_run", return_value=_jobs_response("job-1")) as run:
+        job = qmm_api.get_job("job-1")
+        assert qmm_api.get_job("job-1") is job
+
+    run.assert_called_once()